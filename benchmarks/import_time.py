@@ -0,0 +1,73 @@
+"""
+Time importing the package's modules, each in a fresh interpreter, and list the
+heavy dependencies each one loads.
+
+    python -m benchmarks.import_time --repeat 5
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from typing import Dict, List
+
+# the modules to time, from the lightweight core to the ones that need pandas or gql
+MODULES = (
+    "mondaydotcom_utils",
+    "mondaydotcom_utils.formatted_value",
+    "mondaydotcom_utils.ingest",
+    "mondaydotcom_utils.graphql",
+)
+HEAVY_MODULES = ("pandas", "numpy", "gql", "aiohttp", "graphql")
+
+_SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - started
+print(json.dumps({{"seconds": seconds, "loaded": [name for name in {heavy!r} if name in sys.modules]}}))
+"""
+
+
+def import_time(module: str, repeat: int = 3) -> Dict:
+    """
+    The best of `repeat` times to import `module` in a new interpreter, and the
+    heavy dependencies it loaded.
+    """
+    best: Dict = {"seconds": float("inf"), "loaded": []}
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", _SCRIPT.format(module=module, heavy=HEAVY_MODULES)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        result = json.loads(output)
+        if result["seconds"] < best["seconds"]:
+            best = result
+
+    return best
+
+
+def report(results: Dict[str, Dict]):
+    """
+    Print the results as a table.
+    """
+    print(f"{'module':<40} {'ms':>10}  loads")
+    for name, result in results.items():
+        loaded: List[str] = result["loaded"]
+        print(f"{name:<40} {result['seconds'] * 1000:>10.1f}  {', '.join(loaded) or '-'}")
+
+
+def main(argv=None):
+    # pylint: disable="missing-function-docstring"
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3, help="timings to take the best of")
+    parser.add_argument("modules", nargs="*", default=MODULES, help="modules to import")
+    args = parser.parse_args(argv)
+
+    report({module: import_time(module, args.repeat) for module in args.modules})
+
+
+if __name__ == "__main__":
+    main()
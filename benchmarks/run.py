@@ -0,0 +1,115 @@
+"""
+Time the formatters on a synthetic board and report rows/sec and peak memory.
+
+    python -m benchmarks.run --items 20000 --repeat 3
+"""
+
+import argparse
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from benchmarks.synthetic import KNOWN_TYPES, UNKNOWN_TYPES, make_board, make_col_defs
+from mondaydotcom_utils.formatted_value import (
+    FormattedBoard,
+    FormattedValue,
+    get_items_by_board,
+)
+from mondaydotcom_utils.testing import FakeMondayClient
+
+
+def measure(func: Callable, rows: int, repeat: int = 3) -> Dict:
+    """
+    The best of `repeat` timings of `func()`, as rows/sec, and its peak traced memory.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "seconds": best,
+        "rows_per_sec": rows / best if best else float("inf"),
+        "peak_mb": peak / 2**20,
+    }
+
+
+def bench_formatters(board: Dict, repeat: int) -> Dict[str, Dict]:
+    """
+    Each column type's formatter on all of that column's cells.
+    """
+    columns = FormattedValue(make_col_defs(board)).columns
+    cells: Dict[str, List] = {}
+    for item in board["items"]:
+        for col in item["column_values"]:
+            cells.setdefault(col["id"], []).append((col["value"], col["text"]))
+
+    results = {}
+    for column_id, column_cells in cells.items():
+        column = columns[column_id]
+
+        def format_cells(column=column, column_cells=column_cells):
+            for value, text in column_cells:
+                column(value, text)
+
+        results[f"formatter {column.title}"] = measure(format_cells, len(column_cells), repeat)
+
+    return results
+
+
+def bench_board(board: Dict, repeat: int) -> Dict[str, Dict]:
+    """
+    FormattedBoard.format + to_df, and get_items_by_board against a stub connection.
+    """
+    col_defs = make_col_defs(board)
+    rows = len(board["items"])
+    conn = FakeMondayClient({1: board})
+
+    return {
+        "FormattedBoard.format + to_df": measure(
+            lambda: FormattedBoard(col_defs).load(board["items"]).to_df(), rows, repeat
+        ),
+        "get_items_by_board (stub)": measure(lambda: get_items_by_board(conn, 1), rows, repeat),
+    }
+
+
+def report(results: Dict[str, Dict]):
+    """
+    Print the results as a table.
+    """
+    print(f"{'benchmark':<40} {'rows/sec':>14} {'seconds':>10} {'peak MB':>10}")
+    for name, result in results.items():
+        print(
+            f"{name:<40} {result['rows_per_sec']:>14,.0f} "
+            f"{result['seconds']:>10.4f} {result['peak_mb']:>10.1f}"
+        )
+
+
+def main(argv=None):
+    # pylint: disable="missing-function-docstring"
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=10_000, help="items on the synthetic board")
+    parser.add_argument("--columns", type=int, default=1, help="columns of each type")
+    parser.add_argument("--repeat", type=int, default=3, help="timings to take the best of")
+    parser.add_argument("--empty-ratio", type=float, default=0.2, help="share of empty cells")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    type_counts = {column_type: args.columns for column_type in KNOWN_TYPES + UNKNOWN_TYPES}
+    board = make_board(args.items, type_counts, empty_ratio=args.empty_ratio, seed=args.seed)
+
+    results = bench_formatters(board, args.repeat)
+    results.update(bench_board(board, args.repeat))
+    report(results)
+
+
+if __name__ == "__main__":
+    main()
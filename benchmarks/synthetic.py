@@ -0,0 +1,215 @@
+# pylint: disable="missing-module-docstring"
+
+import json
+import random
+from typing import Callable, Dict, List, Optional, Tuple
+
+from mondaydotcom_utils.formatted_value import to_col_defs
+
+# every type FormattedValue formats, plus ones it doesn't (which use the default)
+KNOWN_TYPES = (
+    "color",
+    "dropdown",
+    "long-text",
+    "date",
+    "numeric",
+    "text",
+    "tag",
+    "multiple-person",
+    "board-relation",
+    "dependency",
+    "formula",
+    "lookup",
+    "timerange",
+    "duration",
+    "subtasks",
+    "boolean",
+)
+UNKNOWN_TYPES = ("hour", "location")
+
+STATUS_LABELS = ("Working on it", "Done", "Stuck", "Waiting")
+DROPDOWN_LABELS = [{"id": label_id, "name": f"Option {label_id}"} for label_id in range(1, 9)]
+WORDS = "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor".split()
+
+
+def _timestamp(rng: random.Random) -> str:
+    return (
+        f"2022-{rng.randint(1, 12):02}-{rng.randint(1, 28):02}T{rng.randint(0, 23):02}:48:21.426Z"
+    )
+
+
+def _date(rng: random.Random) -> str:
+    return f"2022-{rng.randint(1, 12):02}-{rng.randint(1, 28):02}"
+
+
+def _words(rng: random.Random, count: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(count))
+
+
+def _linked(rng: random.Random, with_changed_at: bool = True) -> Tuple[Dict, str]:
+    pulse_ids = [rng.randint(1_000_000_000, 9_999_999_999) for _ in range(rng.randint(1, 4))]
+    value: Dict = {"linkedPulseIds": [{"linkedPulseId": pulse_id} for pulse_id in pulse_ids]}
+    if with_changed_at:
+        value["changed_at"] = _timestamp(rng)
+    return value, ", ".join(f"Item {pulse_id}" for pulse_id in pulse_ids)
+
+
+def _color(rng):
+    label = rng.randrange(len(STATUS_LABELS))
+    return {"index": label, "post_id": None, "changed_at": _timestamp(rng)}, STATUS_LABELS[label]
+
+
+def _dropdown(rng):
+    labels = rng.sample(DROPDOWN_LABELS, rng.randint(1, 3))
+    return {"ids": [label["id"] for label in labels]}, ", ".join(label["name"] for label in labels)
+
+
+def _long_text(rng):
+    text = _words(rng, rng.randint(20, 200))
+    return {"text": text, "changed_at": _timestamp(rng)}, text
+
+
+def _date_value(rng):
+    date = _date(rng)
+    return {"date": date, "icon": None, "changed_at": _timestamp(rng)}, date
+
+
+def _numeric(rng):
+    number = str(rng.randint(0, 1000)) if rng.random() < 0.7 else f"{rng.uniform(0, 100):.2f}"
+    return number, number
+
+
+def _text(rng):
+    text = _words(rng, rng.randint(1, 8))
+    return text, text
+
+
+def _tag(rng):
+    tag_ids = rng.sample(range(14_000_000, 14_000_050), rng.randint(1, 3))
+    return {"tag_ids": tag_ids}, ", ".join(f"tag{tag_id}" for tag_id in tag_ids)
+
+
+def _person(rng):
+    people = [
+        {"id": rng.randint(10_000_000, 99_999_999), "kind": "person"}
+        for _ in range(rng.randint(1, 3))
+    ]
+    return {"changed_at": _timestamp(rng), "personsAndTeams": people}, "Some Person"
+
+
+def _timerange(rng):
+    start, end = sorted((_date(rng), _date(rng)))
+    return {"to": end, "from": start, "changed_at": _timestamp(rng)}, f"{start} - {end}"
+
+
+def _duration(rng):
+    seconds = rng.randint(0, 100_000)
+    value = {
+        "running": rng.random() < 0.1,
+        "duration": seconds,
+        "startDate": rng.randint(1_640_000_000, 1_670_000_000),
+        "changed_at": _timestamp(rng),
+        "additional_value": [],
+    }
+    return value, f"{seconds // 3600:02}:{seconds // 60 % 60:02}:{seconds % 60:02}"
+
+
+def _boolean(rng):
+    return {"checked": "true", "changed_at": _timestamp(rng)}, "v"
+
+
+def _hour(rng):
+    hour = rng.randint(0, 23)
+    return {"hour": hour, "minute": 0, "changed_at": _timestamp(rng)}, f"{hour}:00"
+
+
+def _location(rng):
+    return {"lat": rng.uniform(-90, 90), "lng": rng.uniform(-180, 180)}, "Somewhere"
+
+
+# (value, text) for a non-empty cell of each type; None when monday.com never sends a value
+VALUE_GENERATORS: Dict[str, Optional[Callable]] = {
+    "color": _color,
+    "dropdown": _dropdown,
+    "long-text": _long_text,
+    "date": _date_value,
+    "numeric": _numeric,
+    "text": _text,
+    "tag": _tag,
+    "multiple-person": _person,
+    "board-relation": _linked,
+    "dependency": _linked,
+    "formula": None,
+    "lookup": None,
+    "timerange": _timerange,
+    "duration": _duration,
+    "subtasks": lambda rng: _linked(rng, with_changed_at=False),
+    "boolean": _boolean,
+    "hour": _hour,
+    "location": _location,
+}
+
+
+def make_columns(type_counts: Dict[str, int]) -> List[Dict]:
+    """
+    Board columns, the name first and then `type_counts[type]` columns of each type.
+    """
+    columns = [{"id": "name", "title": "Name", "type": "name"}]
+    for column_type, count in type_counts.items():
+        for number in range(count):
+            column = {
+                "id": f"{column_type.replace('-', '_')}_{number}",
+                "title": f"{column_type.title()} {number}",
+                "type": column_type,
+            }
+            if column_type == "dropdown":
+                column["settings_str"] = json.dumps({"labels": DROPDOWN_LABELS})
+            columns.append(column)
+
+    return columns
+
+
+def make_board(
+    items: int = 1000,
+    type_counts: Optional[Dict[str, int]] = None,
+    empty_ratio: float = 0.2,
+    seed: int = 0,
+) -> Dict:
+    """
+    A board payload shaped like tests/resources/test_board.json, with `items`
+    items holding a column of each of `type_counts` (by default, one of every
+    known and unknown type). About `empty_ratio` of the cells are empty.
+    """
+    rng = random.Random(seed)
+    if type_counts is None:
+        type_counts = {column_type: 1 for column_type in KNOWN_TYPES + UNKNOWN_TYPES}
+    columns = make_columns(type_counts)
+
+    board_items = []
+    for number in range(items):
+        column_values = []
+        for column in columns[1:]:
+            generator = VALUE_GENERATORS.get(column["type"], _location)
+            value = text = None
+            if generator is not None and rng.random() >= empty_ratio:
+                value, text = generator(rng)
+                value = json.dumps(value)
+            column_values.append(
+                {"id": column["id"], "text": text or "", "type": column["type"], "value": value}
+            )
+        board_items.append(
+            {
+                "id": str(1_000_000_000 + number),
+                "name": f"Item {number}",
+                "column_values": column_values,
+            }
+        )
+
+    return {"name": "Synthetic Board", "columns": columns, "items": board_items}
+
+
+def make_col_defs(board: Dict) -> Dict:
+    """
+    The col_defs of a `make_board` board, keyed by column id.
+    """
+    return to_col_defs(board["columns"])
@@ -1,2 +1,39 @@
 # pylint: disable="missing-module-docstring"
+import importlib
+
 __version__ = "0.2"
+
+# the public names, and the module each is loaded from on first use, so importing the
+# package (or formatting rows) doesn't pull in pandas or the GraphQL client
+_LAZY_NAMES = {
+    "EdgeTable": "edges",
+    "FormattedBoard": "formatted_value",
+    "FormattedValue": "formatted_value",
+    "get_col_defs": "formatted_value",
+    "get_items_by_board": "formatted_value",
+    "stream_items_by_board": "formatted_value",
+    "fetch_board_json": "ingest",
+    "format_board_json": "ingest",
+    "TTLCache": "cache",
+    "MondayDotComClient": "graphql",
+    "sync_board": "sync",
+    "write_back": "writeback",
+    "LiveBoard": "webhooks",
+    "WebhookReceiver": "webhooks",
+}
+
+__all__ = ["__version__", *_LAZY_NAMES]
+
+
+def __getattr__(name):
+    module = _LAZY_NAMES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES))
@@ -0,0 +1,137 @@
+# pylint: disable="missing-module-docstring"
+
+import functools
+import logging
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+# pandas is only imported to build dataframes, so formatting rows doesn't pay for it
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=None)
+def datetime_format() -> Optional[str]:
+    """
+    monday.com dates and timestamps are ISO 8601, e.g. "2022-05-02", "2022-05-02T19:48:21.426Z";
+    pandas before 2.0 can't be told so, but infers it quickly from the first value.
+    """
+    import pandas as pd  # pylint: disable="import-outside-toplevel"
+
+    return "ISO8601" if int(pd.__version__.split(".", 1)[0]) >= 2 else None
+
+
+class ColumnBuffers:
+    """
+    One list per output column, all the same length.
+
+    The schema (output key -> dtype name) is fixed up front; rows are reserved
+    in blocks with `grow` and filled in place with `set`, so no dict is kept per row.
+    Keys a formatter emits outside of the schema are added on first non-null value.
+    """
+
+    def __init__(self, schema: Dict[str, str]):
+
+        self.dtypes = dict(schema)
+        self.buffers: Dict[str, List] = {key: [] for key in self.dtypes}
+        self.length = 0
+
+    def grow(self, count: int) -> int:
+        """
+        Reserve `count` more rows, filled with None. Returns the first new row index.
+        """
+        start = self.length
+        padding = [None] * count
+        for buffer in self.buffers.values():
+            buffer.extend(padding)
+        self.length += count
+
+        return start
+
+    def set(self, row: int, values: Dict):
+        """
+        Write the name-value pairs of one formatted cell into `row`.
+        """
+        buffers = self.buffers
+        for key, value in values.items():
+            try:
+                buffers[key][row] = value
+            except KeyError:
+                # an empty value for an unknown key is already represented by None
+                if value is None:
+                    continue
+                logger.debug("Adding column %s, which is not in the board schema.", key)
+                buffers[key] = [None] * self.length
+                buffers[key][row] = value
+                self.dtypes[key] = "object"
+
+    def to_df(self) -> "pd.DataFrame":
+        """
+        Build the dataframe in one pass, converting each buffer to its schema dtype.
+        """
+        import pandas as pd  # pylint: disable="import-outside-toplevel"
+
+        return pd.DataFrame(
+            {key: convert_column(buffer, self.dtypes[key]) for key, buffer in self.buffers.items()},
+            index=pd.RangeIndex(self.length),
+        )
+
+
+def _to_numbers(series: "pd.Series", integer: bool = False) -> "pd.Series":
+    import pandas as pd  # pylint: disable="import-outside-toplevel"
+
+    numbers = pd.to_numeric(series, errors="coerce")
+    if integer or (numbers.dropna() % 1 == 0).all():
+        return numbers.astype("Int64")
+    return numbers.astype("Float64")
+
+
+def _to_datetimes(series: "pd.Series", utc: bool = False) -> "pd.Series":
+    import pandas as pd  # pylint: disable="import-outside-toplevel"
+
+    return pd.to_datetime(series, errors="coerce", utc=utc, format=datetime_format())
+
+
+def _epoch_to_datetimes(series: "pd.Series") -> "pd.Series":
+    import pandas as pd  # pylint: disable="import-outside-toplevel"
+
+    return pd.to_datetime(pd.to_numeric(series, errors="coerce"), unit="s", utc=True)
+
+
+def _to_booleans(series: "pd.Series") -> "pd.Series":
+    # some booleans, e.g. a duration's "running", arrive as strings
+    return series.replace({"true": True, "false": False}).astype("boolean")
+
+
+# how convert_column converts each schema dtype; the rest stay object series
+COLUMN_CONVERTERS: Dict[str, Callable[["pd.Series"], "pd.Series"]] = {
+    "id": functools.partial(_to_numbers, integer=True),
+    "numeric": _to_numbers,
+    "date": _to_datetimes,
+    "timestamp": functools.partial(_to_datetimes, utc=True),
+    "epoch": _epoch_to_datetimes,
+    "boolean": _to_booleans,
+    "category": lambda series: series.astype("category"),
+}
+
+
+def convert_column(values: List, dtype: str) -> "pd.Series":
+    """
+    Convert a list of formatted values to a series of the named schema dtype:
+
+    - "id" and "numeric" become Int64 (Float64 if any value is fractional)
+    - "date" becomes naive datetime64, "timestamp" UTC datetime64, both from ISO 8601
+    - "epoch" (seconds since 1970) becomes UTC datetime64
+    - "boolean" and "category" become the pandas extension types of the same name
+    - anything else stays an object series
+
+    Numbers may arrive as text, e.g. "4", "" or "2.5", and are converted here,
+    a column at a time, rather than cell by cell.
+    """
+    import pandas as pd  # pylint: disable="import-outside-toplevel"
+
+    series = pd.Series(values, dtype=object)
+    converter = COLUMN_CONVERTERS.get(dtype)
+
+    return converter(series) if converter else series
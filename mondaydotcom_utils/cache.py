@@ -0,0 +1,129 @@
+# pylint: disable="missing-module-docstring"
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """
+    A least-recently-used cache of JSON-serializable values that expire after `ttl` seconds.
+
+    Holds at most `maxsize` entries in memory. With a `directory`, entries are
+    also written there as JSON files, so they outlive the process; an entry
+    missing from memory is looked for on disk before it counts as a miss.
+    """
+
+    # pylint: disable="too-many-arguments"
+    def __init__(
+        self,
+        maxsize: int = 128,
+        ttl: float = 3600.0,
+        directory: Optional[Union[str, Path]] = None,
+        clock=time.time,
+    ):
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.directory = Path(directory) if directory is not None else None
+        self.clock = clock
+
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _path(directory: Path, key: str) -> Path:
+
+        digest = hashlib.sha256(key.encode("UTF-8")).hexdigest()
+        return directory / f"{digest}.json"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        The value cached under `key`, or `default` if there is none or it has expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is None and self.directory is not None:
+            entry = self._read(self.directory, key)
+            if entry is not None:
+                self._remember(key, entry)
+
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= self.clock():
+            self.invalidate(key)
+            return default
+
+        return value
+
+    def set(self, key: str, value: Any):
+        """
+        Cache `value` under `key` for `ttl` seconds.
+        """
+        entry = (self.clock() + self.ttl, value)
+        self._remember(key, entry)
+
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._path(self.directory, key).write_text(
+                json.dumps({"key": key, "expires_at": entry[0], "value": value}),
+                encoding="UTF-8",
+            )
+
+    def invalidate(self, key: Optional[str] = None):
+        """
+        Drop `key` from the cache, or everything when `key` is None.
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+        if self.directory is None or not self.directory.is_dir():
+            return
+
+        directory = self.directory
+        paths = directory.glob("*.json") if key is None else [self._path(directory, key)]
+        for path in paths:
+            path.unlink(missing_ok=True)
+
+    def _remember(self, key: str, entry: tuple):
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _read(self, directory: Path, key: str) -> Optional[tuple]:
+
+        path = self._path(directory, key)
+        if not path.is_file():
+            return None
+
+        try:
+            stored = json.loads(path.read_text(encoding="UTF-8"))
+        except ValueError:
+            logger.warning("Ignoring unreadable cache file %s", path)
+            return None
+
+        if stored.get("key") != key:
+            return None
+
+        return stored["expires_at"], stored["value"]
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,91 @@
+# pylint: disable="missing-module-docstring"
+
+from array import array
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+# pandas and numpy are only imported to build dataframes
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def linked_pulse_ids(value: Dict) -> List[int]:
+    """
+    The item ids in a board relation, dependency or subtasks value.
+    """
+    return [pulse["linkedPulseId"] for pulse in value.get("linkedPulseIds") or ()]
+
+
+def people(value: Dict) -> List[Tuple[int, str]]:
+    """
+    The id and kind, "person" or "team", of each person and team in a people value.
+    """
+    return [(person["id"], person["kind"]) for person in value.get("personsAndTeams") or ()]
+
+
+def tag_ids(value: Dict) -> List[int]:
+    """
+    The tag ids in a tags value.
+    """
+    return value.get("tag_ids") or []
+
+
+# the multi-valued column types whose links also have a kind, e.g. a person or a team
+KINDED_EDGE_TYPES = ("multiple-person",)
+
+
+class EdgeTable:
+    """
+    The links of one multi-valued column, e.g. a board relation, as two parallel
+    int64 arrays: the item that links, and the id it links to.
+
+    With `kinds`, the targets are added as (id, kind) pairs and their kinds kept
+    in a third list, as people columns hold both person and team ids.
+    """
+
+    __slots__ = ("sources", "targets", "kinds")
+
+    def __init__(self, kinds: bool = False):
+
+        self.sources = array("q")
+        self.targets = array("q")
+        self.kinds: Optional[List[str]] = [] if kinds else None
+
+    def add(self, source: int, targets: List):
+        """
+        Link the item `source` to each of `targets`.
+        """
+        self.sources.extend([source] * len(targets))
+        if self.kinds is None:
+            self.targets.extend(targets)
+            return
+
+        for target, kind in targets:
+            self.targets.append(target)
+            self.kinds.append(kind)
+
+    def extend(self, sources: array, targets: array, kinds: Optional[List[str]]):
+        """
+        Append the links of another table's `sources`, `targets` and `kinds`.
+        """
+        self.sources.extend(sources)
+        self.targets.extend(targets)
+        if self.kinds is not None and kinds is not None:
+            self.kinds.extend(kinds)
+
+    def to_df(self) -> "pd.DataFrame":
+        """
+        The links as a target_id column, and with `kinds` a categorical kind
+        column, indexed by monday_id, one row per link.
+        """
+        # pylint: disable="import-outside-toplevel"
+        import numpy as np
+        import pandas as pd
+
+        data = {"target_id": np.frombuffer(self.targets, dtype=np.int64).copy()}
+        if self.kinds is not None:
+            data["kind"] = pd.Categorical(self.kinds)
+
+        return pd.DataFrame(
+            data,
+            index=pd.Index(np.frombuffer(self.sources, dtype=np.int64).copy(), name="monday_id"),
+        )
@@ -1,26 +1,103 @@
 # pylint: disable="missing-module-docstring"
 
-import json
 import logging
-from typing import Dict
-
-import numpy as np
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+from mondaydotcom_utils import instrumentation, json_backend, queries
+from mondaydotcom_utils.buffers import ColumnBuffers
+from mondaydotcom_utils.edges import (
+    KINDED_EDGE_TYPES,
+    EdgeTable,
+    linked_pulse_ids,
+    people,
+    tag_ids,
+)
+from mondaydotcom_utils.relations import get_subitems
+
+# pandas is only imported to build dataframes, so formatting rows doesn't pay for it
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
 
-def get_items_by_board(conn, board_id, column_id="", column_value=""):
+# pylint: disable="too-many-arguments, too-many-locals"
+def get_items_by_board(
+    conn,
+    board_id,
+    column_id="",
+    column_value="",
+    col_defs_cache=None,
+    columns=None,
+    subitems=False,
+    filters=None,
+    filter_operator="and",
+):
     """
     A common function to lookup all items on a specific board.
     Setting column_id and column_value, to e.g.,
     "status" and "Done" will fetch only those items,
     otherwise the entire board will be fetched.
 
-    Returns a dataframe.
+    With a `col_defs_cache` (see `get_col_defs`) the column definitions are only
+    fetched when they aren't cached; if the cached ones no longer fit the items,
+    they are dropped and fetched again.
+
+    `columns`, a list of column ids or titles, limits the values fetched and
+    formatted to those columns. With `subitems` the subitems column is fetched
+    too, to find the subitems, but is only formatted if it's one of `columns`.
+
+    `filters`, a list of rules (see `queries.filter_query_params`) on column ids
+    or titles, fetches only the matching items: those matching all of the rules,
+    or with `filter_operator` "or", any of them.
+
+    Returns a dataframe, or, with `subitems`, the items, their subitems and each
+    item's subitem ids, see `relations.get_subitems`.
     """
 
-    if column_id:
+    # Grab a map of column IDs, their settings, and proper names.
+    col_defs = get_col_defs(conn, board_id, cache=col_defs_cache)
+
+    query_params = None
+    if filters is not None:
+        if column_id:
+            raise ValueError("Pass either column_id and column_value, or filters")
+        query_params = queries.filter_query_params(
+            [resolve_filter(col_defs, rule) for rule in filters], filter_operator
+        )
+
+    column_ids = fetched_ids = None
+    if columns is not None:
+        try:
+            column_ids = resolve_columns(col_defs, columns)
+        except ValueError:
+            if col_defs_cache is None:
+                raise
+
+            # a column may have been added since they were cached
+            col_defs_cache.invalidate(str(board_id))
+            col_defs = get_col_defs(conn, board_id, cache=col_defs_cache)
+            column_ids = resolve_columns(col_defs, columns)
+
+        # the subitem ids are read from the subitems column, fetched but not formatted
+        fetched_ids = column_ids + [
+            col_id
+            for col_id, col_def in col_defs.items()
+            if subitems and col_def["type"] == "subtasks" and col_id not in column_ids
+        ]
+
+    if column_ids is not None or query_params is not None:
+        # only the paged queries can select which column values, or items, to fetch
+        fields = queries.item_fields(fetched_ids)
+        items = [
+            item
+            for page in iter_board_pages(
+                conn, board_id, column_id, column_value, query_params=query_params, fields=fields
+            )
+            for item in page
+        ]
+    elif column_id:
         # if a column_id is set, then use one graphql query...
         test_board = conn.items.fetch_items_by_column_value(board_id, column_id, column_value)
         items = test_board["data"]["items_by_column_values"]
@@ -29,70 +106,433 @@ def get_items_by_board(conn, board_id, column_id="", column_value=""):
         test_board = conn.boards.fetch_items_by_board_id(board_id)
         items = test_board["data"]["boards"][0]["items"]
 
-    # Grab a map of column IDs, their settings, and proper names.
-    col_defs = get_col_defs(conn, board_id)
-
     # format the column values
-    formatted_board = FormattedBoard(col_defs)
-    formatted_board.format(items)
+    try:
+        formatted_board = FormattedBoard(col_defs, columns=column_ids)
+        formatted_board.load(items)
+    except (KeyError, TypeError, ValueError):
+        if not invalidate_stale_col_defs(col_defs_cache, board_id):
+            raise
+        col_defs = get_col_defs(conn, board_id, cache=col_defs_cache)
+
+        formatted_board = FormattedBoard(col_defs, columns=column_ids)
+        formatted_board.load(items)
 
     result_df = formatted_board.to_df()
 
+    if subitems:
+        subitems_df, children = get_subitems(conn, items, col_defs, col_defs_cache=col_defs_cache)
+        return result_df, subitems_df, children
+
     return result_df
 
 
-def get_col_defs(monday_conn, board_id):
+def get_col_defs(monday_conn, board_id, cache=None):
     """
     Get the column definitions. Useful for formatting values later.
 
     from https://github.com/ProdPerfect/monday/wiki/Code-Examples#whole-board-formatting-example
+
+    `cache` is an optional `TTLCache`, keyed by board id; call its `invalidate`
+    with the board id when the board's columns change.
     """
+    if cache is not None:
+        col_defs = cache.get(str(board_id))
+        if col_defs is not None:
+            return col_defs
+
     data = monday_conn.boards.fetch_boards_by_id(board_id)
     columns = data["data"]["boards"][0]["columns"]
+    col_defs = to_col_defs(columns)
+
+    if cache is not None:
+        cache.set(str(board_id), col_defs)
+
+    # returns a dict
+    return col_defs
+
+
+def invalidate_stale_col_defs(cache, board_id) -> bool:
+    """
+    After formatting a board with column definitions from `cache` failed, drop
+    them, as the board's columns have probably changed since they were cached.
+
+    Returns False when there's no cache, i.e. the failure wasn't down to it.
+    """
+    if cache is None:
+        return False
+
+    logger.warning("Cached column definitions for board %s are stale, refetching.", board_id)
+    cache.invalidate(str(board_id))
+    return True
+
 
+def to_col_defs(columns):
+    """
+    Key a board's list of columns by column id.
+    """
     col_defs = {}
     for column in columns:
         col_defs[column["id"]] = column
 
-    # returns a dict
     return col_defs
 
 
+def resolve_columns(col_defs, columns) -> List[str]:
+    """
+    The ids of `columns`, a list of column ids or titles, in the order given.
+
+    A title matches every column with that title. Raises ValueError for
+    anything that is neither.
+    """
+    column_ids: List[str] = []
+    for column in columns:
+        if column in col_defs:
+            matches = [column]
+        else:
+            matches = [col_id for col_id, col_def in col_defs.items() if col_def["title"] == column]
+        if not matches:
+            raise ValueError(f"No column with id or title {column!r}")
+
+        column_ids.extend(col_id for col_id in matches if col_id not in column_ids)
+
+    return column_ids
+
+
+def resolve_filter(col_defs, rule):
+    """
+    A filter rule (see `queries.filter_query_params`) with its column title, if
+    it has one, replaced by the column's id.
+    """
+    if isinstance(rule, dict) or rule[0] in col_defs:
+        return rule
+
+    return (resolve_columns(col_defs, [rule[0]])[0], *rule[1:])
+
+
+def iter_board_pages(
+    conn,
+    board_id,
+    column_id="",
+    column_value="",
+    page_size=500,
+    query_params=None,
+    fields=queries.ITEM_FIELDS,
+):
+    """
+    Page through the items on a board with cursors, yielding one list of items per page.
+
+    As with `get_items_by_board`, setting column_id and column_value will fetch
+    only the matching items. The next page is requested as soon as a page arrives,
+    so it is fetched while the caller works on the current one -- except inside a
+    client's sync session, where pages are fetched in turn.
+
+    `query_params` (see `queries.items_page_query`) filters the items on the server
+    and `fields` is the selection made on each item.
+    """
+    if column_id:
+        query = queries.items_page_by_column_values_query(
+            board_id, column_id, column_value, page_size, fields
+        )
+        items_page = queries.execute(conn, query)["items_page_by_column_values"]
+    else:
+        query = queries.items_page_query(board_id, page_size, query_params, fields)
+        items_page = queries.execute(conn, query)["boards"][0]["items_page"]
+
+    # a sync session's event loop can only be driven from the thread that opened it
+    prefetch = not getattr(conn, "thread_bound", False)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        while True:
+            query, next_page = None, None
+            if items_page["cursor"]:
+                query = queries.next_items_page_query(items_page["cursor"], page_size, fields)
+                if prefetch:
+                    next_page = executor.submit(queries.execute, conn, query)
+
+            yield items_page["items"]
+
+            if query is None:
+                break
+            result = next_page.result() if next_page else queries.execute(conn, query)
+            items_page = result["next_items_page"]
+
+
+def stream_items_by_board(
+    conn,
+    board_id,
+    column_id="",
+    column_value="",
+    page_size=500,
+    col_defs=None,
+    col_defs_cache=None,
+    columns=None,
+):
+    """
+    Like `get_items_by_board`, but yields a formatted dataframe per page of items
+    so memory stays flat on large boards. Always yields at least one, possibly
+    empty, dataframe; use `concat_chunks` to put them back together.
+    """
+    if col_defs is None:
+        col_defs = get_col_defs(conn, board_id, cache=col_defs_cache)
+
+    formatted_board = FormattedBoard(col_defs, columns=columns)
+    fields = queries.item_fields(formatted_board.column_ids)
+    for items in iter_board_pages(
+        conn, board_id, column_id, column_value, page_size, fields=fields
+    ):
+        yield formatted_board.load(items).to_df()
+
+
+def concat_chunks(chunks) -> "pd.DataFrame":
+    """
+    Concatenate the dataframes from `stream_items_by_board` into one.
+
+    Categorical columns are re-categorized over the whole board,
+    since each chunk only knows its own categories.
+    """
+    import pandas as pd  # pylint: disable="import-outside-toplevel"
+
+    chunks = list(chunks)
+    result_df = pd.concat(chunks, ignore_index=True)
+
+    for column, dtype in chunks[0].dtypes.items():
+        if isinstance(dtype, pd.CategoricalDtype):
+            result_df[column] = result_df[column].astype("category")
+
+    return result_df
+
+
 # pylint: disable="missing-class-docstring"
 class FormattedBoard:
 
-    # pylint: disable="missing-function-docstring"
-    def __init__(self, col_defs):
+    # pylint: disable="missing-function-docstring, too-many-arguments"
+    def __init__(self, col_defs, columns=None, bulk_decode=False, edges=False):
 
         self.col_defs = col_defs
-        self.rows = []
 
-    def format(self, items):
+        # decode each batch's JSON values with one call instead of one per cell
+        self.bulk_decode = bulk_decode
+
+        # with `edges`, multi-valued columns go to `to_edges` instead of list cells
+        self.with_edges = edges
+        self.edges: Dict[str, EdgeTable] = {}
 
-        item_formatter = FormattedValue(self.col_defs)
-        self.rows = []
+        # with `columns` (ids or titles), only those are formatted, the rest skipped
+        self.column_ids = None
+        if columns is not None:
+            self.column_ids = resolve_columns(col_defs, columns)
+            col_defs = {col_id: col_defs[col_id] for col_id in self.column_ids}
 
-        # build up a dict of name-value pairs
+        # compile the column definitions once for the whole board
+        self.columns = FormattedValue(col_defs, numeric_text=True, edges=edges).columns
+        self.buffers = ColumnBuffers(self.schema())
+        self.edges = self.edge_tables()
+
+    def schema(self) -> Dict[str, str]:
+        """
+        The output columns and their dtype names, in column definition order.
+
+        Duplicate column titles share one output column.
+        """
+        schema = {"monday_id": "id", "monday_name": "object"}
+        for column in self.columns.values():
+            if column.edges is not None:
+                continue
+            for key, dtype in column.schema:
+                schema.setdefault(key, dtype)
+
+        return schema
+
+    def edge_tables(self) -> Dict[str, EdgeTable]:
+        """
+        An empty `EdgeTable` per multi-valued column title, when formatting edges.
+        """
+        return {
+            column.title: EdgeTable(kinds=column.column_type in KINDED_EDGE_TYPES)
+            for column in self.columns.values()
+            if column.edges is not None
+        }
+
+    def format(self, items) -> List[Dict]:
+        """
+        Format `items` as the board's rows, replacing any formatted before,
+        and return them as a list of name-value dicts (see `rows`).
+        """
+        return self.load(items).rows
+
+    def load(self, items) -> "FormattedBoard":
+        """
+        Like `format`, but return the board itself rather than building the row
+        dicts, e.g. for `board.load(items).to_df()`.
+        """
+        self.buffers = ColumnBuffers(self.schema())
+        self.edges = self.edge_tables()
+        self.append(items)
+
+        return self
+
+    def format_parallel(self, items, workers: Optional[int] = None, chunk_size: int = 10_000):
+        """
+        Like `load`, but formats the items across a pool of processes,
+        see `parallel.format_parallel`.
+        """
+        # parallel imports this module, so it's imported when first needed
+        # pylint: disable="import-outside-toplevel, cyclic-import"
+        from mondaydotcom_utils.parallel import format_parallel
+
+        return format_parallel(self, items, workers=workers, chunk_size=chunk_size)
+
+    def append(self, items):
+        """
+        Format more items onto the end of the board.
+        """
+        if not isinstance(items, list):
+            items = list(items)
+
+        columns = self.columns
+        projected = self.column_ids is not None
+        buffers = self.buffers
+        ids = buffers.buffers["monday_id"]
+        names = buffers.buffers["monday_name"]
+
+        edges = self.edges
+        decoded = iter(self.decode_values(items)) if self.bulk_decode else None
+
+        for row, item in enumerate(items, start=buffers.grow(len(items))):
+            ids[row] = item["id"]
+            names[row] = item["name"]
+            for col in item["column_values"]:
+                column = columns.get(col["id"])
+                if column is None:
+                    # not one of the projected columns; otherwise, not on the board
+                    if projected:
+                        continue
+                    raise KeyError(col["id"])
+
+                value = col["value"]
+                if column.decode and value is not None:
+                    value = json_backend.loads(value) if decoded is None else next(decoded)
+
+                if column.edges is not None:
+                    if value is not None:
+                        edges[column.title].add(int(item["id"]), column.edges(value))
+                    continue
+                buffers.set(row, column.formatter(column, value, col["text"]))
+
+        return self
+
+    def decode_values(self, items) -> List:
+        """
+        The decoded JSON values of `items`, in the order `append` formats them.
+        """
+        columns = self.columns
+        values = []
         for item in items:
-            row_dict = {}
-            row_dict["monday_id"] = item["id"]
-            row_dict["monday_name"] = item["name"]
             for col in item["column_values"]:
-                col_dict = item_formatter.format(col["id"], col["value"], col["text"])
-                row_dict.update(col_dict)
-            self.rows.append(row_dict)
+                column = columns.get(col["id"])
+                if column is not None and column.decode and col["value"] is not None:
+                    values.append(col["value"])
 
-        return self.rows
+        return json_backend.loads_many(values)
+
+    @property
+    def rows(self) -> List[Dict]:
+        """
+        The formatted items as a list of name-value dicts.
+        """
+        keys = list(self.buffers.buffers)
+        return [dict(zip(keys, values)) for values in zip(*self.buffers.buffers.values())]
 
     def to_df(self):
 
-        # create a dataframe
-        result_df = pd.DataFrame(self.rows)
+        return self.buffers.to_df()
+
+    def to_edges(self) -> Dict[str, "pd.DataFrame"]:
+        """
+        With `edges`, a table of links per multi-valued column title, see `EdgeTable`.
+        """
+        return {title: edge_table.to_df() for title, edge_table in self.edges.items()}
+
+
+class FormattedColumn:
+    """
+    A single column definition, resolved once per board.
+
+    Holds the column title, the formatter bound to its type, any settings
+    parsed out of `settings_str`, and the output keys the formatter emits, so
+    that formatting a cell is one call with no lookups against `col_defs`.
+
+    For a column with `decode` set, the cell's value is decoded from JSON, once,
+    before it is handed to the formatter. A column with `edges` is a multi-valued
+    one whose value `FormattedBoard` stores as links, using that to list the ids.
+    """
+
+    # one slot per compiled property, so formatting never looks at col_defs
+    # pylint: disable="too-many-instance-attributes"
+    __slots__ = (
+        "column_id",
+        "title",
+        "column_type",
+        "formatter",
+        "settings",
+        "keys",
+        "schema",
+        "decode",
+        "edges",
+    )
+
+    # pylint: disable="too-many-arguments"
+    def __init__(
+        self,
+        col_def: Dict,
+        formatter: Callable,
+        settings: Optional[Dict] = None,
+        schema: Tuple[Tuple[Optional[str], str], ...] = (),
+        decode: bool = False,
+        edges: Optional[Callable] = None,
+    ):
+
+        self.column_id = col_def["id"]
+        self.title = col_def["title"]
+        self.column_type = col_def["type"]
+        self.formatter = formatter
+        self.settings = settings or {}
+        self.keys: Dict[str, str] = {}
+        self.decode = decode
+        self.edges = edges
+
+        # (output key, dtype name) for every key the formatter is expected to emit
+        self.schema = tuple(
+            (self.title if suffix is None else self.key(suffix), dtype) for suffix, dtype in schema
+        )
+
+    def key(self, suffix: str) -> str:
+        """
+        The output key for `suffix`, e.g. "Status__text", built once per column.
+        """
+        try:
+            return self.keys[suffix]
+        except KeyError:
+            key = self.keys[suffix] = f"{self.title}__{suffix}"
+            return key
+
+    def __call__(self, value, text) -> Dict:
+        if self.decode and value is not None:
+            value = json_backend.loads(value)
+        return self.formatter(self, value, text)
+
+    def __repr__(self):
+        return f"FormattedColumn({self.column_id!r}, {self.title!r}, {self.column_type!r})"
 
-        # # change the monday_id to an integer
-        result_df["monday_id"] = pd.to_numeric(result_df["monday_id"])
 
-        return result_df
+def parse_dropdown_settings(col_def: Dict) -> Dict:
+    """
+    Dropdown values hold label ids; map them back to label names.
+    """
+    settings_str = col_def.get("settings_str")
+    labels = json_backend.loads(settings_str)["labels"] if settings_str else []
+    return {"label_map": {row["id"]: row["name"] for row in labels}}
 
 
 class FormattedValue:
@@ -106,12 +546,75 @@ class FormattedValue:
     Column titles in the UI can be duplicates. Duplicate column names can have unexpected results,
     and are not supported.
 
-    Each formatter returns a list with zero, one, or more name-value pairs in a dict.
+    The column definitions are compiled once, up front, into a `FormattedColumn`
+    per column id (see `columns`). Each formatter receives that compiled column
+    and returns a dict with zero, one, or more name-value pairs. The values of
+    the types in `json_types` arrive already decoded, see `json_backend`.
     """
 
-    def __init__(self, col_defs: Dict):
+    # column types whose value is JSON, decoded before it reaches the formatter
+    JSON_TYPES = frozenset(
+        {
+            "color",
+            "dropdown",
+            "long-text",
+            "text",
+            "tag",
+            "multiple-person",
+            "board-relation",
+            "dependency",
+            "timerange",
+            "duration",
+            "subtasks",
+            "boolean",
+        }
+    )
+
+    # multi-valued column types, and how to list the ids in their decoded value
+    TYPE_TO_EDGES_MAP: Dict[str, Callable] = {
+        "board-relation": linked_pulse_ids,
+        "dependency": linked_pulse_ids,
+        "subtasks": linked_pulse_ids,
+        "multiple-person": people,
+        "tag": tag_ids,
+    }
+
+    # column types whose settings_str is needed while formatting
+    TYPE_TO_SETTINGS_MAP: Dict[str, Callable] = {
+        "dropdown": parse_dropdown_settings,
+    }
+
+    # the keys each column type emits, as (suffix, dtype name); None is the bare title
+    TYPE_TO_SCHEMA_MAP: Dict[str, Tuple] = {
+        # the name is not a column value; it is formatted as monday_name
+        "name": (),
+        "color": (("text", "category"), ("changed_at", "timestamp")),
+        "date": ((None, "date"),),
+        "numeric": ((None, "numeric"),),
+        "formula": (("formula", "object"),),
+        "lookup": (("mirror", "object"),),
+        "timerange": (
+            ("from", "date"),
+            ("to", "date"),
+            ("changed_at", "timestamp"),
+            ("visualization_type", "object"),
+        ),
+        "duration": (
+            ("running", "boolean"),
+            ("duration", "numeric"),
+            ("startDate", "epoch"),
+            ("changed_at", "timestamp"),
+            ("additional_value", "object"),
+        ),
+        "boolean": (("checked", "boolean"), ("changed_at", "timestamp")),
+    }
+    DEFAULT_SCHEMA = ((None, "object"),)
+    UNKNOWN_TYPE_SCHEMA = ((None, "object"), ("default_formatter", "boolean"))
+
+    def __init__(self, col_defs: Dict, numeric_text: bool = False, edges: bool = False):
 
         self.col_defs = col_defs
+        self.edges = edges
 
         self.type_to_callable_map = {
             "color": self.format_color_field,
@@ -132,52 +635,95 @@ class FormattedValue:
             "boolean": self.format_boolean_field,
         }
 
+        # a whole board converts its numbers a column at a time, see `buffers.convert_column`
+        if numeric_text:
+            self.type_to_callable_map["numeric"] = self.format_numeric_text_field
+
+        self.columns = self._compile()
+
+    def _compile(self) -> Dict[str, FormattedColumn]:
+        """
+        Resolve every column definition to a `FormattedColumn`, keyed by column id.
+        """
+        columns = {}
+        for column_id, col_def in self.col_defs.items():
+            columns[column_id] = self._compile_column(col_def)
+
+        return columns
+
+    def _compile_column(self, col_def: Dict) -> FormattedColumn:
+        """
+        Bind the formatter for the column's type, using the default if one isn't found,
+        and parse any settings the formatter needs.
+        """
+        field_type = col_def["type"]
+        formatter = self.type_to_callable_map.get(field_type, self.format_default)
+
+        if instrumentation.metrics.enabled:
+            formatter = instrumentation.metrics.timed_formatter(
+                formatter, field_type, fallback=field_type not in self.type_to_callable_map
+            )
+
+        settings = None
+        settings_parser = self.TYPE_TO_SETTINGS_MAP.get(field_type)
+        if settings_parser is not None:
+            settings = settings_parser(col_def)
+
+        if field_type in self.TYPE_TO_SCHEMA_MAP:
+            schema = self.TYPE_TO_SCHEMA_MAP[field_type]
+        elif field_type in self.type_to_callable_map:
+            schema = self.DEFAULT_SCHEMA
+        else:
+            schema = self.UNKNOWN_TYPE_SCHEMA
+
+        edges = self.TYPE_TO_EDGES_MAP.get(field_type) if self.edges else None
+
+        return FormattedColumn(
+            col_def, formatter, settings, schema, decode=field_type in self.JSON_TYPES, edges=edges
+        )
+
     @staticmethod
-    def format_default(field_name, value, text) -> Dict:
+    def format_default(column, value, text) -> Dict:
         """
         When no other formatter matches, use this as the default.
         """
         logger.debug(
             "The default formatter is being used, field_name=%s, value=%s, text=%s",
-            field_name,
+            column.title,
             value,
             text,
         )
-        return {field_name: value, f"{field_name}__default_formatter": True}
+        return {column.title: value, column.key("default_formatter"): True}
 
     @staticmethod
     # pylint: disable="unused-argument, missing-function-docstring"
-    def format_lookup_field(field_name, value, text) -> Dict:
+    def format_lookup_field(column, value, text) -> Dict:
         """
         Lookup fields aren't exported, so almost a straight default here.
         """
-        return {f"{field_name}__mirror": None}
+        return {column.key("mirror"): None}
 
     @staticmethod
     # pylint: disable="unused-argument, missing-function-docstring"
-    def format_formula_field(field_name, value, text) -> Dict:
+    def format_formula_field(column, value, text) -> Dict:
         """
         Formula fields aren't exported, so almost a straight default here.
         """
-        return {f"{field_name}__formula": None}
+        return {column.key("formula"): None}
 
     @staticmethod
     # pylint: disable="unused-argument, missing-function-docstring"
-    def format_text_field(field_name, value, text):
-        retval = None
-        if value is not None:
-            retval = json.loads(value)
-
-        return {field_name: retval}
+    def format_text_field(column, value, text):
+        return {column.title: value}
 
     @staticmethod
     # pylint: disable="unused-argument, missing-function-docstring"
-    def format_date_field(field_name, value, text):
+    def format_date_field(column, value, text):
         retval = None
         if value is not None:
             retval = text
 
-        return {field_name: retval}
+        return {column.title: retval}
 
     @staticmethod
     def convert_numeric(value):
@@ -187,186 +733,177 @@ class FormattedValue:
         This funciton breaks them out, or if the string is empty, spaces,
         or zero-length return NaN.
         """
+        if not value:
+            return float("nan")
         try:
             return int(value)
         except ValueError:
             try:
                 return float(value)
             except ValueError:
-                return np.nan
+                return float("nan")
 
     # pylint: disable="unused-argument, missing-function-docstring"
-    def format_numeric_field(self, field_name, value, text):
-        return {field_name: self.convert_numeric(text)}
+    def format_numeric_field(self, column, value, text):
+        return {column.title: self.convert_numeric(text)}
+
+    @staticmethod
+    # pylint: disable="unused-argument"
+    def format_numeric_text_field(column, value, text):
+        """
+        The number as text, or None when it's empty, to be converted with its column.
+        """
+        return {column.title: text or None}
 
     @staticmethod
     # pylint: disable="unused-argument, missing-function-docstring"
-    def format_longtext_field(field_name, value, text):
+    def format_longtext_field(column, value, text):
         retval = None
         if value is not None:
-            value = json.loads(value)["text"]
+            value = value["text"]
             retval = value.strip() if value else None
 
-        return {field_name: retval}
+        return {column.title: retval}
 
     @staticmethod
     # pylint: disable="unused-argument, missing-function-docstring"
-    def format_timerange_field(field_name, value, text):
+    def format_timerange_field(column, value, text):
         my_dict = {}
         retval = None
         if value is not None:
-            value_json = json.loads(value)
-            for k, v in value_json.items():  # pylint: disable="invalid-name"
-                my_dict.update({f"{field_name}__{k}": v})
+            for k, v in value.items():  # pylint: disable="invalid-name"
+                my_dict[column.key(k)] = v
             return my_dict
 
-        return {field_name: retval}
+        return {column.title: retval}
 
     @staticmethod
     # pylint: disable="unused-argument, missing-function-docstring"
-    def format_tag_field(field_name, value, text):
+    def format_tag_field(column, value, text):
         retval = None
         if value is not None:
-            retval = json.loads(value)["tag_ids"]
-        return {field_name: retval}
+            retval = value["tag_ids"]
+        return {column.title: retval}
 
     @staticmethod
     # pylint: disable="unused-argument, missing-function-docstring"
-    def format_color_field(field_name, value, text):
+    def format_color_field(column, value, text):
         my_dict = {}
 
         if value is not None:
             if text:
-                my_dict.update({f"{field_name}__text": text})
-
-            value_json = json.loads(value)
+                my_dict[column.key("text")] = text
 
-            if value_json.get("changed_at"):
-                my_dict.update({f"{field_name}__changed_at": value_json["changed_at"]})
+            if value.get("changed_at"):
+                my_dict[column.key("changed_at")] = value["changed_at"]
 
             return my_dict
 
-        return {field_name: None}
+        return {column.title: None}
 
     @staticmethod
     # pylint: disable="unused-argument, missing-function-docstring"
-    def format_boolean_field(field_name, value, text):
+    def format_boolean_field(column, value, text):
         my_dict = {}
 
         if value is not None:
 
-            value_json = json.loads(value)
-            my_dict.update({f"{field_name}__checked": True})
+            my_dict[column.key("checked")] = True
 
-            if value_json.get("changed_at"):
-                my_dict.update({f"{field_name}__changed_at": value_json["changed_at"]})
+            if value.get("changed_at"):
+                my_dict[column.key("changed_at")] = value["changed_at"]
 
         else:
-            my_dict.update({f"{field_name}__checked": False})
+            my_dict[column.key("checked")] = False
 
         return my_dict
 
     @staticmethod
     # pylint: disable="unused-argument, missing-function-docstring"
-    def format_boardrelation_field(field_name, value, text):
+    def format_boardrelation_field(column, value, text):
         if value is not None:
             try:
-                json_val = json.loads(value)
                 rows = []
-                if json_val.get("linkedPulseIds"):
-                    for pulse_id in json.loads(value)["linkedPulseIds"]:
+                if value.get("linkedPulseIds"):
+                    for pulse_id in value["linkedPulseIds"]:
                         rows.append(pulse_id["linkedPulseId"])
-                return {field_name: rows}
+                return {column.title: rows}
 
             except BaseException as ex:  # pylint: disable="broad-except"
                 logger.exception(ex)
 
-        return {field_name: None}
+        return {column.title: None}
 
     @staticmethod
     # pylint: disable="unused-argument, missing-function-docstring"
-    def format_subtasks_field(field_name, value, text):
+    def format_subtasks_field(column, value, text):
         if value is not None:
             try:
-                json_val = json.loads(value)
                 rows = []
-                if json_val.get("linkedPulseIds"):
-                    for pulse_id in json.loads(value)["linkedPulseIds"]:
+                if value.get("linkedPulseIds"):
+                    for pulse_id in value["linkedPulseIds"]:
                         rows.append(pulse_id["linkedPulseId"])
                 if len(rows) > 0:
-                    return {field_name: rows}
+                    return {column.title: rows}
 
             except BaseException as ex:  # pylint: disable="broad-except"
                 logger.exception(ex)
 
-        return {field_name: None}
+        return {column.title: None}
 
     @staticmethod
     # pylint: disable="unused-argument, missing-function-docstring"
-    def format_dependency_field(field_name, value, text):
+    def format_dependency_field(column, value, text):
         if value is not None:
             try:
-                json_val = json.loads(value)
                 rows = []
-                if json_val.get("linkedPulseIds"):
-                    for pulse_id in json.loads(value)["linkedPulseIds"]:
+                if value.get("linkedPulseIds"):
+                    for pulse_id in value["linkedPulseIds"]:
                         rows.append(pulse_id["linkedPulseId"])
-                return {field_name: rows}
+                return {column.title: rows}
 
             except BaseException as ex:  # pylint: disable="broad-except"
                 logger.exception(ex)
 
-        return {field_name: None}
+        return {column.title: None}
 
     @staticmethod
     # pylint: disable="unused-argument, missing-function-docstring"
-    def format_duration_field(field_name, value, text):
+    def format_duration_field(column, value, text):
         my_dict = {}
         if value is not None:
             try:
-                json_val = json.loads(value)
-
-                for k, v in json_val.items():  # pylint: disable="invalid-name"
-                    my_dict.update({f"{field_name}__{k}": v})
+                for k, v in value.items():  # pylint: disable="invalid-name"
+                    my_dict[column.key(k)] = v
                 return my_dict
 
             except BaseException as ex:  # pylint: disable="broad-except"
                 logger.exception(ex)
 
-        return {field_name: None}
+        return {column.title: None}
 
     @staticmethod
     # pylint: disable="unused-argument, missing-function-docstring"
-    def format_person_field(field_name, value, text):
+    def format_person_field(column, value, text):
         if value is not None:
-            return {field_name: json.loads(value)["personsAndTeams"]}
+            return {column.title: value["personsAndTeams"]}
 
-        return {field_name: None}
+        return {column.title: None}
 
+    @staticmethod
     # pylint: disable="unused-argument, missing-function-docstring"
-    def format_dropdown_field(self, field_name, value, text):
+    def format_dropdown_field(column, value, text):
         if value is not None:
-            labels = json.loads(self.col_defs[field_name]["settings_str"])["labels"]
-            # pylint: disable = "consider-using-dict-comprehension"
-            label_map = dict([(row["id"], row["name"]) for row in labels])
-            return {field_name: ", ".join([label_map.get(id) for id in json.loads(value)["ids"]])}
+            label_map = column.settings["label_map"]
+            return {column.title: ", ".join([label_map.get(id) for id in value["ids"]])}
 
-        return {field_name: None}
+        return {column.title: None}
 
     def format(self, field_name, value, text):
         """
-        Get the column type from the column definitions
+        Format one cell, by column id.
 
-        This is the "entry" method; it uses the formatter below
-        to "route" based on the `type_to_callable_map`.
+        This is the "entry" method; the compiled `FormattedColumn` for the
+        column id already carries its title and formatter.
         """
-        field_type = self.col_defs[field_name]["type"]
-        column_name = self.col_defs[field_name]["title"]
-
-        # use the map to lookup the function, using default if one isn't found.
-        formatter = self.type_to_callable_map.get(field_type, self.format_default)
-
-        formatted_items = formatter(column_name, value, text)
-
-        # call the mapped function with the proper column name
-        return formatted_items
+        return self.columns[field_name](value, text)
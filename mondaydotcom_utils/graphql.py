@@ -1,31 +1,232 @@
 # pylint: disable="missing-module-docstring"
+import asyncio
+import contextlib
+import contextvars
+import copy
 import logging
-from typing import Dict
+import time
+from typing import Dict, Iterable, Optional
 
+import aiohttp
 from gql import Client, gql
 from gql.transport.aiohttp import AIOHTTPTransport
 
+from mondaydotcom_utils import instrumentation, queries
+from mondaydotcom_utils.cache import TTLCache
+from mondaydotcom_utils.formatted_value import (
+    FormattedBoard,
+    concat_chunks,
+    invalidate_stale_col_defs,
+    to_col_defs,
+)
+from mondaydotcom_utils.rate_limit import ComplexityBudget, RetryPolicy, with_complexity
+from mondaydotcom_utils.schema import (
+    load_schema_snapshot,
+    save_schema_snapshot,
+    schema_cache_path,
+)
+
 logger = logging.getLogger(__name__)
 
-# pylint: disable="too-few-public-methods"
+
+# the size of the last response body read by the current task, for metrics
+_response_bytes: contextvars.ContextVar = contextvars.ContextVar("response_bytes", default=0)
+
+
+class SizedClientResponse(aiohttp.ClientResponse):
+    """
+    An aiohttp response that notes the size of its body as it's read.
+    """
+
+    async def read(self) -> bytes:
+
+        body = await super().read()
+        _response_bytes.set(len(body))
+        return body
+
+
+class PooledAIOHTTPTransport(AIOHTTPTransport):
+    """
+    An AIOHTTPTransport with a configurable connection pool size and keep-alive.
+
+    The aiohttp connector must be made inside the running event loop,
+    so it is made when the transport connects.
+    """
+
+    def __init__(self, *args, pool_size: int = 100, keepalive_timeout: float = 15.0, **kwargs):
+
+        super().__init__(*args, **kwargs)
+        self.pool_size = pool_size
+        self.keepalive_timeout = keepalive_timeout
+
+    async def connect(self):
+
+        if self.session is None:
+            self.client_session_args = dict(self.client_session_args or {})
+            self.client_session_args["connector"] = aiohttp.TCPConnector(
+                limit=self.pool_size, keepalive_timeout=self.keepalive_timeout
+            )
+            self.client_session_args.setdefault("response_class", SizedClientResponse)
+
+        await super().connect()
+
+    def subscribe(self, document, variable_values=None, operation_name=None):
+
+        raise NotImplementedError("monday.com's API doesn't support subscriptions")
+
+
 class MondayDotComClient:
     """
     A wrapper around the graphql client
+
+    By default each query opens and closes its own connection. To keep a pool of
+    connections alive across many queries, use the client as a session:
+
+        with MondayDotComClient(monday_key=key) as client:
+            client.query(...)
+
+        async with MondayDotComClient(monday_key=key) as client:
+            await client.query_async(...)
+
+    or call `open`/`close` (`open_async`/`close_async`) directly.
+
+    Queries are validated against the monday.com schema. `schema` says where it comes from:
+
+    - "remote", the default, downloads it by introspection when the first session opens
+    - "cached" uses the snapshot under the user's cache directory (see `schema_cache_path`)
+      if it was saved for this package and `api_version`, otherwise downloads and saves it
+    - "none" skips validation, so no schema is ever loaded
+    - anything else is the path of a snapshot saved with `save_schema`
+
+    Snapshots are only built when the first session opens.
+
+    With a `response_cache`, a `TTLCache`, query responses are cached by query
+    text and variables (mutations never are). `cache_mode` says how it's used:
+
+    - "cache", the default, answers from the cache when it can and caches the rest
+    - "record" always queries monday.com and caches, i.e. records, every response
+    - "replay" only answers from the cache and never connects, not even for a
+      session; a query that wasn't recorded raises LookupError
+
+    For recordings that outlive the process, give the cache a `directory`
+    and an infinite `ttl`.
     """
 
-    def __init__(self, url: str = "https://api.monday.com/v2", monday_key: str = ""):
+    # the settings, caches and the open session and its loop
+    # pylint: disable="too-many-arguments,too-many-instance-attributes"
+    def __init__(
+        self,
+        url: str = "https://api.monday.com/v2",
+        monday_key: str = "",
+        budget: Optional[ComplexityBudget] = None,
+        retry: Optional[RetryPolicy] = None,
+        pool_size: int = 100,
+        keepalive_timeout: float = 15.0,
+        schema: str = "remote",
+        api_version: Optional[str] = None,
+        col_defs_cache: Optional[TTLCache] = None,
+        response_cache: Optional[TTLCache] = None,
+        cache_mode: str = "cache",
+    ):
+
+        # every query is paced against the complexity budget and retried when throttled
+        self.budget = budget or ComplexityBudget()
+        self.retry = retry or RetryPolicy()
+
+        # column definitions by board id, see `get_col_defs`
+        self.col_defs_cache = col_defs_cache
+
+        if cache_mode not in ("cache", "record", "replay"):
+            raise ValueError(f"Unknown cache_mode {cache_mode!r}")
+        self.response_cache = response_cache
+        self.cache_mode = cache_mode
 
         headers = {"Authorization": monday_key}
+        if api_version:
+            headers["API-Version"] = api_version
 
         # Select your transport with a defined url endpoint
-        transport = AIOHTTPTransport(url=url, headers=headers)
+        transport = PooledAIOHTTPTransport(
+            url=url, headers=headers, pool_size=pool_size, keepalive_timeout=keepalive_timeout
+        )
 
         # Create a GraphQL client using the defined transport
         self.client = Client(
             transport=transport,
-            fetch_schema_from_transport=True,
+            fetch_schema_from_transport=schema in ("remote", "cached"),
         )
 
+        self.schema_mode = schema
+        self.api_version = api_version
+        self._schema_loaded = False
+        self._schema_saved = False
+
+        # the open gql session, and for a sync session the event loop it runs on
+        self._session = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def open(self):
+        """
+        Open a long-lived session for synchronous queries.
+        """
+        if self._session is None and self.cache_mode != "replay":
+            self._load_schema()
+            self._loop = asyncio.new_event_loop()
+            self._session = self._loop.run_until_complete(self.client.connect_async())
+            self._save_schema()
+
+        return self
+
+    def close(self):
+        """
+        Close a session opened with `open`.
+        """
+        if self._loop is not None:
+            self._loop.run_until_complete(self.client.close_async())
+            self._loop.close()
+
+        self._session = None
+        self._loop = None
+
+    @property
+    def thread_bound(self):
+        """
+        Whether a sync session is open, so queries must come from the thread that opened it.
+        """
+        return self._loop is not None
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    async def open_async(self):
+        """
+        Open a long-lived session for asynchronous queries.
+        """
+        if self._session is None and self.cache_mode != "replay":
+            self._load_schema()
+            self._session = await self.client.connect_async()
+            self._save_schema()
+
+        return self
+
+    async def close_async(self):
+        """
+        Close a session opened with `open_async`.
+        """
+        if self._session is not None:
+            await self.client.close_async()
+
+        self._session = None
+
+    async def __aenter__(self):
+        return await self.open_async()
+
+    async def __aexit__(self, *exc_info):
+        await self.close_async()
+
     def query(self, query: str, variables: Dict = None):
         """
         Hand in query -- as triple quoted string, e.g. -- and
@@ -38,10 +239,296 @@ class MondayDotComClient:
             logger.warning("Query called with improper variable structure.")
             return None
 
+        return self._run(self.query_async(query, variables))
+
+    def _run(self, coroutine):
+        """
+        Run `coroutine` to completion, on the sync session's event loop if one is open.
+        """
+        if self._loop is not None:
+            return self._loop.run_until_complete(coroutine)
+
+        return asyncio.run(coroutine)
+
+    async def query_async(self, query: str, variables: Optional[Dict] = None):
+        """
+        As `query`, from async code. Uses the open session if there is one.
+        """
+        async with self._session_scope() as session:
+            return await self._execute_async(session, query, variables)
+
+    @contextlib.asynccontextmanager
+    async def _session_scope(self):
+        """
+        The open session, or else one for just the duration of the block.
+        When replaying, there's no session at all, so nothing ever connects.
+        """
+        if self.cache_mode == "replay":
+            yield None
+            return
+
+        if self._session is not None:
+            yield self._session
+            return
+
+        self._load_schema()
+        async with self.client as session:
+            self._save_schema()
+            yield session
+
+    def _load_schema(self):
+        """
+        Build the schema from its snapshot, once, for the snapshot modes.
+        """
+        if self._schema_loaded:
+            return
+        self._schema_loaded = True
+
+        if self.schema_mode == "cached":
+            path = schema_cache_path(self.api_version)
+            self.client.schema = load_schema_snapshot(path, self.api_version)
+        elif self.schema_mode not in ("remote", "none"):
+            self.client.schema = load_schema_snapshot(self.schema_mode, check_version=False)
+            if self.client.schema is None:
+                raise FileNotFoundError(f"No schema snapshot at {self.schema_mode}")
+
+    def _save_schema(self):
+        """
+        In "cached" mode, keep a schema just downloaded for next time.
+        """
+        if self.schema_mode != "cached" or self._schema_saved:
+            return
+
+        if self.client.introspection is not None:
+            save_schema_snapshot(
+                self.client.schema, schema_cache_path(self.api_version), self.api_version
+            )
+            self._schema_saved = True
+
+    def save_schema(self, path: Optional[str] = None):
+        """
+        Save the schema as a snapshot at `path`, by default the cache path,
+        downloading it first if it hasn't been already.
+        """
+        if self.client.schema is None:
+            self._run(self._fetch_schema())
+        if self.client.schema is None:
+            raise RuntimeError("The monday.com schema couldn't be downloaded")
+
+        save_schema_snapshot(
+            self.client.schema, path or schema_cache_path(self.api_version), self.api_version
+        )
+
+    async def _fetch_schema(self):
+        """
+        Download the schema by introspection, over the open session if there is one.
+        """
+        if self._session is not None:
+            await self._session.fetch_schema()
+            return
+
+        fetch_schema_from_transport = self.client.fetch_schema_from_transport
+        self.client.fetch_schema_from_transport = True
+        try:
+            async with self.client:
+                pass
+        finally:
+            self.client.fetch_schema_from_transport = fetch_schema_from_transport
+
+    def budget_state(self) -> Dict:
+        """
+        The current state of the local complexity budget.
+        """
+        return self.budget.state()
+
+    def _retry_delay(self, ex: BaseException, attempt: int) -> Optional[float]:
+        """
+        How long to wait before retrying after `ex`, or None to give up.
+        """
+        headers = getattr(self.client.transport, "response_headers", None)
+        retryable, throttled, retry_after = self.retry.classify(ex, headers)
+
+        if throttled:
+            self.budget.exhausted(retry_after)
+
+        if not retryable or attempt + 1 >= self.retry.max_attempts:
+            return None
+
+        delay = self.retry.delay(attempt, retry_after)
+        logger.warning("Query failed (%s), retrying in %.1fs.", ex, delay)
+        return delay
+
+    # pylint: disable="too-many-arguments"
+    def _settle(
+        self,
+        query: str,
+        reserved: int,
+        result: Dict,
+        tracked: bool,
+        seconds: float = 0.0,
+        payload_bytes: int = 0,
+    ) -> Dict:
+        """
+        Record the reported complexity and drop it from the result if we asked for it.
+
+        With metrics enabled, also record the query's latency, response size and cost.
+        """
+        complexity = result.pop("complexity", None) if tracked else result.get("complexity")
+        self.budget.record(query, reserved, complexity)
+
+        if instrumentation.metrics.enabled:
+            instrumentation.metrics.record_query(
+                seconds, payload_bytes, (complexity or {}).get("query")
+            )
+
+        return result
+
+    def fetch_boards(self, board_ids: Iterable, max_concurrency: int = 8, page_size: int = 500):
+        """
+        Blocking wrapper around `fetch_boards_async`.
+        """
+        return self._run(self.fetch_boards_async(board_ids, max_concurrency, page_size))
+
+    async def fetch_boards_async(
+        self, board_ids: Iterable, max_concurrency: int = 8, page_size: int = 500
+    ):
+        """
+        Fetch the items and column definitions of many boards concurrently,
+        over one shared session, with at most `max_concurrency` queries in flight.
+
+        Returns a dict of board id to a dataframe, as `get_items_by_board` would return.
+        """
+        board_ids = list(board_ids)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch_all(session):
+            return await asyncio.gather(
+                *(
+                    self._fetch_board_async(session, semaphore, board_id, page_size)
+                    for board_id in board_ids
+                )
+            )
+
+        async with self._session_scope() as session:
+            results = await fetch_all(session)
+
+        return dict(zip(board_ids, results))
+
+    async def _execute_async(
+        self, session, query: str, variables: Optional[Dict] = None, semaphore=None
+    ):
+        """
+        Run one query on `session`, answered from and saved to the response
+        cache as `cache_mode` says (mutations never are), see `_execute_paced`.
+        """
+        key = None
+        if self.response_cache is not None and not query.lstrip().startswith("mutation"):
+            key = queries.query_cache_key(query, variables)
+            if self.cache_mode != "record":
+                result = self.response_cache.get(key)
+                if result is not None:
+                    return copy.deepcopy(result)
+
+        if session is None:
+            raise LookupError(f"No recorded response to {queries.normalize_query(query)}")
+
+        result = await self._execute_paced(session, query, variables, semaphore)
+        if self.response_cache is not None and key is not None:
+            self.response_cache.set(key, copy.deepcopy(result))
+
+        return result
+
+    async def _execute_paced(
+        self, session, query: str, variables: Optional[Dict] = None, semaphore=None
+    ):
+        """
+        Run one query on `session`, paced against the complexity budget, retrying
+        throttled and failed attempts, with at most one slot of `semaphore` held.
+        """
+        query, tracked = with_complexity(query)
+        document = gql(query)
+
+        attempt = 0
+        while True:
+            reserved = self.budget.estimate(query)
+            wait = self.budget.reserve(reserved)
+            if wait:
+                logger.info("Waiting %.1fs for complexity budget.", wait)
+                await asyncio.sleep(wait)
+
+            _response_bytes.set(0)
+            try:
+                if semaphore is None:
+                    started = time.perf_counter()
+                    result = await self._send(session, document, variables)
+                else:
+                    async with semaphore:
+                        started = time.perf_counter()
+                        result = await self._send(session, document, variables)
+            except Exception as ex:  # pylint: disable="broad-except"
+                self.budget.release(reserved)
+                delay = self._retry_delay(ex, attempt)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            seconds = time.perf_counter() - started
+            return self._settle(query, reserved, result, tracked, seconds, _response_bytes.get())
+
+    @staticmethod
+    async def _send(session, document, variables: Optional[Dict]):
+
         # Execute the query on the transport
         if variables:
-            result = self.client.execute(gql(query), variable_values=variables)
+            return await session.execute(document, variable_values=variables)
+
+        return await session.execute(document)
+
+    async def _fetch_board_async(
+        self, session, semaphore, board_id, page_size: int, use_cache: bool = True
+    ):
+
+        cache = self.col_defs_cache if use_cache else None
+        col_defs = cache.get(str(board_id)) if cache is not None else None
+        items_query = queries.items_page_query(board_id, page_size)
+
+        if col_defs is None:
+            # the column definitions and the first page don't depend on each other
+            columns_data, page_data = await asyncio.gather(
+                self._execute_async(session, queries.columns_query(board_id), semaphore=semaphore),
+                self._execute_async(session, items_query, semaphore=semaphore),
+            )
+            col_defs = to_col_defs(columns_data["boards"][0]["columns"])
+            if self.col_defs_cache is not None:
+                self.col_defs_cache.set(str(board_id), col_defs)
         else:
-            result = self.client.execute(gql(query))
+            page_data = await self._execute_async(session, items_query, semaphore=semaphore)
 
-        return result
+        try:
+            return await self._format_pages_async(
+                session, semaphore, FormattedBoard(col_defs), page_data, page_size
+            )
+        except (KeyError, TypeError, ValueError):
+            if not invalidate_stale_col_defs(cache, board_id):
+                raise
+            return await self._fetch_board_async(
+                session, semaphore, board_id, page_size, use_cache=False
+            )
+
+    async def _format_pages_async(
+        self, session, semaphore, formatted_board, page_data, page_size: int
+    ):
+        """
+        Format the first page of a board's items and every page after it.
+        """
+        items_page = page_data["boards"][0]["items_page"]
+        chunks = [formatted_board.load(items_page["items"]).to_df()]
+        while items_page["cursor"]:
+            query = queries.next_items_page_query(items_page["cursor"], page_size)
+            data = await self._execute_async(session, query, semaphore=semaphore)
+            items_page = data["next_items_page"]
+            chunks.append(formatted_board.load(items_page["items"]).to_df())
+
+        return concat_chunks(chunks)
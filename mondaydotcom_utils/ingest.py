@@ -0,0 +1,268 @@
+# pylint: disable="missing-module-docstring"
+
+import asyncio
+import logging
+from contextlib import ExitStack
+from pathlib import Path
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from mondaydotcom_utils import queries
+from mondaydotcom_utils.formatted_value import FormattedBoard, to_col_defs
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# where a board is in a response to boards(ids: [...]) { columns {...} items {...} },
+# the shape of saved boards such as tests/resources/test_board.json
+BOARD_PREFIX = "data.boards.item"
+
+# where the page of items is in a response to an items_page or next_items_page query
+ITEMS_PAGE_PREFIX = "data.boards.item.items_page"
+NEXT_ITEMS_PAGE_PREFIX = "data.next_items_page"
+
+
+def _import_ijson():
+
+    try:
+        import ijson  # pylint: disable="import-outside-toplevel"
+    except ImportError as ex:
+        raise ImportError("Streaming ingestion needs ijson: pip install ijson") from ex
+
+    return ijson
+
+
+# pylint: disable="too-few-public-methods"
+class _BoardEvents:
+    """
+    Builds the columns, items, cursor and errors of a board response from its
+    ijson events, see `iter_board_json`.
+    """
+
+    def __init__(self, ijson, board_prefix: str, items_prefix: str):
+
+        self.object_builder = ijson.ObjectBuilder
+        self.targets = {
+            f"{board_prefix}.columns.item": "columns",
+            f"{items_prefix}.items.item": "items",
+            "errors.item": "errors",
+        }
+        self.cursor_prefix = f"{items_prefix}.cursor"
+
+        # the kind and builder of the column, item or error being read
+        self.kind = ""
+        self.builder: Any = None
+
+    def event(self, prefix: str, event: str, value) -> Optional[Tuple[str, Any]]:
+        """
+        Feed one event; returns a (kind, value) pair when one is complete.
+        """
+        if self.builder is None:
+            if event == "start_map" and prefix in self.targets:
+                self.kind = self.targets[prefix]
+                self.builder = self.object_builder()
+                self.builder.event(event, value)
+            elif prefix == self.cursor_prefix and event in ("string", "null"):
+                return "cursor", value
+            return None
+
+        self.builder.event(event, value)
+        if event == "end_map" and prefix in self.targets:
+            value, self.builder = self.builder.value, None
+            return self.kind, value
+
+        return None
+
+
+def iter_board_json(
+    source: IO[bytes], board_prefix: str = BOARD_PREFIX, items_prefix: Optional[str] = None
+) -> Iterator[Tuple[str, Any]]:
+    """
+    Parse a board response incrementally, yielding ("columns", column) and
+    ("items", item) pairs as each column and item is read, without loading the
+    whole response.
+
+    The columns are read from under `board_prefix` and the items from under
+    `items_prefix`, by default the same. For a page of items, e.g. with
+    `ITEMS_PAGE_PREFIX` or `NEXT_ITEMS_PAGE_PREFIX`, its ("cursor", cursor) is
+    yielded too, and any ("errors", error) the response holds.
+
+    `source` is a binary file, or any object with a `read` method such as the
+    raw body of a streamed HTTP response. Needs the optional ijson package.
+    """
+    ijson = _import_ijson()
+    events = _BoardEvents(ijson, board_prefix, items_prefix or board_prefix)
+
+    for prefix, event, value in ijson.parse(source, use_float=True):
+        parsed = events.event(prefix, event, value)
+        if parsed is not None:
+            yield parsed
+
+
+async def aiter_board_json(
+    source, board_prefix: str = BOARD_PREFIX, items_prefix: Optional[str] = None
+) -> AsyncIterator[Tuple[str, Any]]:
+    """
+    Like `iter_board_json`, but `source` has an async `read` method, such as
+    an aiohttp response's `content`.
+    """
+    ijson = _import_ijson()
+    events = _BoardEvents(ijson, board_prefix, items_prefix or board_prefix)
+
+    async for prefix, event, value in ijson.parse_async(source, use_float=True):
+        parsed = events.event(prefix, event, value)
+        if parsed is not None:
+            yield parsed
+
+
+class _StreamedBoard:
+    """
+    Formats a board's columns and items `batch_size` at a time as they're parsed,
+    keeping the last cursor seen.
+    """
+
+    def __init__(self, col_defs: Optional[Dict], batch_size: int, board_options: Dict):
+
+        self.col_defs = col_defs
+        self.batch_size = batch_size
+        self.board_options = board_options
+
+        self.columns: List[Dict] = []
+        self.formatted_board: Optional[FormattedBoard] = None
+        self.batch: List[Dict] = []
+        self.cursor: Optional[str] = None
+
+    def add(self, kind: str, value):
+        """
+        Add one ("columns", column), ("items", item), ("cursor", cursor) or
+        ("errors", error) pair from `iter_board_json`.
+        """
+        if kind == "errors":
+            raise queries.QueryError([value])
+        if kind == "cursor":
+            self.cursor = value
+            return
+        if kind == "columns":
+            self.columns.append(value)
+            return
+
+        if self.formatted_board is None:
+            if self.col_defs is None:
+                if not self.columns:
+                    raise ValueError("The board's items came before its columns; pass col_defs")
+                self.col_defs = to_col_defs(self.columns)
+            self.formatted_board = FormattedBoard(self.col_defs, **self.board_options).load([])
+
+        self.batch.append(value)
+        if len(self.batch) >= self.batch_size:
+            self.formatted_board.append(self.batch)
+            self.batch = []
+
+    def to_df(self) -> "pd.DataFrame":
+        """
+        Format the last batch and build the dataframe.
+        """
+        if self.formatted_board is None:
+            self.formatted_board = FormattedBoard(
+                self.col_defs or to_col_defs(self.columns), **self.board_options
+            )
+        self.formatted_board.append(self.batch)
+        self.batch = []
+
+        logger.debug("Formatted %d streamed items.", self.formatted_board.buffers.length)
+        return self.formatted_board.to_df()
+
+
+def format_board_json(
+    source: Union[str, Path, IO[bytes]],
+    col_defs: Optional[Dict] = None,
+    batch_size: int = 1000,
+    board_prefix: str = BOARD_PREFIX,
+    **board_options,
+) -> "pd.DataFrame":
+    """
+    Format a saved board response, e.g. tests/resources/test_board.json, or a
+    streamed one, see `iter_board_json`, into a dataframe.
+
+    Items are formatted `batch_size` at a time as they are parsed, so only the
+    formatted columns and one batch are held, never the whole response.
+    Without `col_defs`, the board's columns must come before its items.
+    Any `board_options` are passed on to `FormattedBoard`.
+    """
+    board = _StreamedBoard(col_defs, batch_size, board_options)
+
+    with ExitStack() as stack:
+        if isinstance(source, (str, Path)):
+            source = stack.enter_context(open(source, "rb"))
+
+        for kind, value in iter_board_json(source, board_prefix):
+            board.add(kind, value)
+
+    return board.to_df()
+
+
+async def _stream_query(session, url: str, query: str, board: _StreamedBoard, items_prefix: str):
+
+    async with session.post(url, json={"query": query}) as response:
+        response.raise_for_status()
+        async for kind, value in aiter_board_json(response.content, BOARD_PREFIX, items_prefix):
+            board.add(kind, value)
+
+
+# pylint: disable="too-many-arguments"
+async def fetch_board_json_async(
+    board_id,
+    monday_key: str,
+    url: str = "https://api.monday.com/v2",
+    api_version: Optional[str] = None,
+    page_size: int = 500,
+    col_defs: Optional[Dict] = None,
+    batch_size: int = 1000,
+    **board_options,
+) -> "pd.DataFrame":
+    """
+    Fetch a board's items a page of `page_size` at a time and format them as
+    each response body streams in, `batch_size` at a time, so no response is
+    ever held whole. Without `col_defs` the columns are fetched first.
+
+    The queries aren't paced against the complexity budget nor retried, as
+    `MondayDotComClient`'s are. Needs the optional ijson package.
+    """
+    import aiohttp  # pylint: disable="import-outside-toplevel"
+
+    headers = {"Authorization": monday_key}
+    if api_version:
+        headers["API-Version"] = api_version
+
+    board = _StreamedBoard(col_defs, batch_size, board_options)
+    async with aiohttp.ClientSession(headers=headers) as session:
+        if col_defs is None:
+            await _stream_query(session, url, queries.columns_query(board_id), board, BOARD_PREFIX)
+
+        query = queries.items_page_query(board_id, page_size)
+        await _stream_query(session, url, query, board, ITEMS_PAGE_PREFIX)
+        while board.cursor:
+            query = queries.next_items_page_query(board.cursor, page_size)
+            board.cursor = None
+            await _stream_query(session, url, query, board, NEXT_ITEMS_PAGE_PREFIX)
+
+    return board.to_df()
+
+
+def fetch_board_json(board_id, monday_key: str, **kwargs) -> "pd.DataFrame":
+    """
+    Run `fetch_board_json_async` to completion.
+    """
+    return asyncio.run(fetch_board_json_async(board_id, monday_key, **kwargs))
@@ -0,0 +1,138 @@
+# pylint: disable="missing-module-docstring"
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Metrics:
+    """
+    Counts and timings of the formatters and of queries, off until `enable`d.
+
+    While disabled nothing is measured: formatters are only compiled with
+    timing when metrics are enabled, so boards compiled before `enable` (or
+    after `disable`) don't pay for it. Read the totals with `snapshot`; each
+    query's measurements are also passed to the `add_callback` callbacks,
+    e.g. to update Prometheus metrics.
+    """
+
+    def __init__(self):
+
+        self.enabled = False
+        self.callbacks: List[Callable[[str, Dict], None]] = []
+        self._lock = threading.Lock()
+
+        self.formatters: Dict[str, List] = {}
+        self.defaults: Dict[str, int] = {}
+        self.queries: Dict[str, float] = {}
+        self.reset()
+
+    def reset(self):
+        """
+        Zero every count and timing.
+        """
+        with self._lock:
+            self.formatters = {}
+            self.defaults = {}
+            self.queries = {"count": 0, "seconds": 0.0, "max_seconds": 0.0, "bytes": 0, "cost": 0}
+
+    def timed_formatter(self, formatter: Callable, column_type: str, fallback: bool = False):
+        """
+        Wrap a formatter to record its calls and time under `column_type`, and,
+        with `fallback`, count the calls per column title as default formatter fallbacks.
+        """
+
+        def timed(column, value, text):
+            started = time.perf_counter()
+            try:
+                return formatter(column, value, text)
+            finally:
+                self.record_format(column_type, time.perf_counter() - started)
+                if fallback:
+                    self.defaults[column.title] = self.defaults.get(column.title, 0) + 1
+
+        return timed
+
+    def record_format(self, column_type: str, seconds: float):
+        """
+        Count one formatter call for `column_type` that took `seconds`.
+        """
+        stats = self.formatters.get(column_type)
+        if stats is None:
+            stats = self.formatters[column_type] = [0, 0.0]
+        stats[0] += 1
+        stats[1] += seconds
+
+    def record_query(self, seconds: float, payload_bytes: int, cost: Optional[int] = None):
+        """
+        Record one query's latency, response size and complexity cost, and pass them on.
+        """
+        with self._lock:
+            self.queries["count"] += 1
+            self.queries["seconds"] += seconds
+            self.queries["max_seconds"] = max(self.queries["max_seconds"], seconds)
+            self.queries["bytes"] += payload_bytes
+            self.queries["cost"] += cost or 0
+
+        measurements = {"seconds": seconds, "bytes": payload_bytes, "cost": cost}
+        for callback in self.callbacks:
+            try:
+                callback("query", measurements)
+            except Exception:  # pylint: disable="broad-except"
+                logger.exception("Metrics callback %r failed", callback)
+
+    def snapshot(self) -> Dict:
+        """
+        A copy of the totals so far.
+        """
+        with self._lock:
+            return {
+                "formatters": {
+                    column_type: {"calls": calls, "seconds": seconds}
+                    for column_type, (calls, seconds) in self.formatters.items()
+                },
+                "default_formatter": dict(self.defaults),
+                "queries": dict(self.queries),
+            }
+
+
+# the metrics the package records into
+metrics = Metrics()
+
+
+def enable():
+    """
+    Start measuring; formatters compiled from now on are timed.
+    """
+    metrics.enabled = True
+
+
+def disable():
+    """
+    Stop measuring; the totals so far are kept.
+    """
+    metrics.enabled = False
+
+
+def snapshot() -> Dict:
+    """
+    The totals recorded so far, see `Metrics.snapshot`.
+    """
+    return metrics.snapshot()
+
+
+def reset():
+    """
+    Zero the totals.
+    """
+    metrics.reset()
+
+
+def add_callback(callback: Callable[[str, Dict], None]):
+    """
+    Call `callback(event, measurements)` for each query recorded, with the event "query".
+    """
+    metrics.callbacks.append(callback)
@@ -0,0 +1,85 @@
+# pylint: disable="missing-module-docstring"
+
+import json
+import logging
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+def _stdlib_loads() -> Callable[[str], Any]:
+    return json.loads
+
+
+def _orjson_loads() -> Callable[[str], Any]:
+    # orjson is a compiled extension pylint can't see into
+    import orjson  # pylint: disable="import-outside-toplevel"
+
+    return orjson.loads  # pylint: disable="no-member"
+
+
+def _msgspec_loads() -> Callable[[str], Any]:
+    import msgspec  # pylint: disable="import-outside-toplevel,import-error"
+
+    decoder = msgspec.json.Decoder()
+
+    def decode(value):
+        try:
+            return decoder.decode(value)
+        except msgspec.DecodeError as ex:
+            # the other backends raise ValueError subclasses; keep one error type
+            raise ValueError(str(ex)) from ex
+
+    return decode
+
+
+# the JSON libraries that can decode column values, fastest first
+BACKENDS: Dict[str, Callable[[], Callable[[str], Any]]] = {
+    "orjson": _orjson_loads,
+    "msgspec": _msgspec_loads,
+    "json": _stdlib_loads,
+}
+
+# pylint: disable="invalid-name"
+backend: str = "json"
+loads: Callable[[str], Any] = json.loads
+
+
+def set_backend(name: Optional[str] = None) -> str:
+    """
+    Decode JSON with the named backend, "orjson", "msgspec" or "json" (the standard
+    library), or, when `name` is None, the fastest one installed. Returns its name.
+
+    Raises ImportError if the named backend isn't installed.
+    """
+    global backend, loads  # pylint: disable="global-statement"
+
+    if name is None:
+        for candidate, load_backend in BACKENDS.items():
+            try:
+                loads = load_backend()
+            except ImportError:
+                continue
+            backend = candidate
+            break
+    else:
+        if name not in BACKENDS:
+            raise ValueError(f"Unknown JSON backend {name!r}, expected one of {list(BACKENDS)}")
+        loads = BACKENDS[name]()
+        backend = name
+
+    logger.debug("Decoding JSON with %s", backend)
+    return backend
+
+
+def loads_many(values: Sequence[str]) -> List[Any]:
+    """
+    Decode a batch of JSON strings with one call, by joining them into an array.
+    """
+    if not values:
+        return []
+
+    return loads(f"[{','.join(values)}]")
+
+
+set_backend()
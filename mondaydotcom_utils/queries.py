@@ -0,0 +1,307 @@
+# pylint: disable="missing-module-docstring"
+
+import json
+import logging
+import re
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# the fields fetched for every item, enough for FormattedBoard
+ITEM_FIELDS = """
+                id
+                name
+                column_values {
+                    id
+                    text
+                    type
+                    value
+                }
+"""
+
+# ...and with when each item was last updated
+UPDATED_ITEM_FIELDS = ITEM_FIELDS + """
+                updated_at
+"""
+
+# what a linked item is resolved to, see relations.RelationResolver
+LINKED_ITEM_FIELDS = """
+                id
+                name
+                board {
+                    id
+                }
+"""
+
+# ...and for subitems, which are formatted with their own board's columns
+SUBITEM_FIELDS = ITEM_FIELDS + """
+                board {
+                    id
+                }
+"""
+
+# just the item ids, e.g. to see which items still exist
+ID_FIELDS = """
+                id
+"""
+
+
+def item_fields(column_ids: Optional[List[str]] = None) -> str:
+    """
+    `ITEM_FIELDS`, but with only the values of the columns in `column_ids`.
+    """
+    if column_ids is None:
+        return ITEM_FIELDS
+
+    return ITEM_FIELDS.replace(
+        "column_values {", f"column_values(ids: {to_literal(column_ids)}) {{"
+    )
+
+
+class GraphQLEnum(str):
+    """
+    A string written into a query as an enum value, i.e. unquoted.
+    """
+
+
+def to_literal(value) -> str:
+    """
+    Write a Python value as a GraphQL input literal, e.g. for `query_params`.
+    """
+    for types, encode in LITERAL_ENCODERS:
+        if isinstance(value, types):
+            return encode(value)
+
+    raise TypeError(f"Can't write {value!r} into a GraphQL query")
+
+
+def _object_literal(value) -> str:
+    fields = ", ".join(f"{key}: {to_literal(field)}" for key, field in value.items())
+    return f"{{{fields}}}"
+
+
+def _list_literal(value) -> str:
+    return f"[{', '.join(to_literal(element) for element in value)}]"
+
+
+# how to_literal writes each type, most specific first: an enum is a str, a bool an int
+LITERAL_ENCODERS = (
+    (GraphQLEnum, str),
+    (str, json.dumps),
+    (bool, lambda value: "true" if value else "false"),
+    (type(None), lambda value: "null"),
+    ((int, float), repr),
+    (dict, _object_literal),
+    ((list, tuple), _list_literal),
+)
+
+
+def normalize_query(query: str) -> str:
+    """
+    `query` with its whitespace, other than inside strings, collapsed to single spaces.
+    """
+    return " ".join(re.findall(r'"(?:\\.|[^"\\])*"|[^\s"]+', query))
+
+
+def query_cache_key(query: str, variables: Optional[Dict] = None) -> str:
+    """
+    A key for the response to `query` with `variables`, the same however the query is laid out.
+    """
+    return f"{normalize_query(query)}\n{json.dumps(variables or {}, sort_keys=True)}"
+
+
+# the operators of an items_page query_params rule
+RULE_OPERATORS = {
+    "any_of",
+    "not_any_of",
+    "is_empty",
+    "is_not_empty",
+    "greater_than",
+    "greater_than_or_equals",
+    "lower_than",
+    "lower_than_or_equal",
+    "between",
+    "contains_text",
+    "not_contains_text",
+    "contains_terms",
+    "starts_with",
+    "ends_with",
+    "within_the_next",
+    "within_the_last",
+}
+
+
+def filter_query_params(filters: List, operator: str = "and") -> Dict:
+    """
+    The `query_params` for `items_page_query` that keep only the items matching
+    `filters`, all of them with the operator "and", any of them with "or".
+
+    Each filter is a (column_id, operator) or (column_id, operator, compare_value)
+    tuple, e.g. ("status", "any_of", [0, 1]), ("date4", "between", ["2022-01-01",
+    "2022-01-31"]) or ("text", "is_empty"), or a rule dict, used as it is.
+    """
+    if operator not in ("and", "or"):
+        raise ValueError(f"Filters are combined with 'and' or 'or', not {operator!r}")
+
+    rules = []
+    for rule in filters:
+        if isinstance(rule, dict):
+            rules.append(rule)
+            continue
+
+        column_id, rule_operator, *compare_value = rule
+        if rule_operator not in RULE_OPERATORS:
+            raise ValueError(f"Unknown filter operator {rule_operator!r}")
+
+        compare_value = compare_value[0] if compare_value else []
+        if not isinstance(compare_value, (list, tuple)):
+            compare_value = [compare_value]
+        rules.append(
+            {
+                "column_id": column_id,
+                "compare_value": list(compare_value),
+                "operator": GraphQLEnum(rule_operator),
+            }
+        )
+
+    return {"rules": rules, "operator": GraphQLEnum(operator)}
+
+
+class QueryError(Exception):
+    """
+    Raised when monday.com answers a query with errors instead of data.
+    """
+
+
+def execute(conn, query: str) -> Dict:
+    """
+    Run a raw query string and return its "data".
+
+    `conn` may be a monday SDK client (queries go through its boards resource),
+    or anything with a `query(query, variables)` method, such as MondayDotComClient.
+    """
+    if hasattr(conn, "query"):
+        return conn.query(query, {})
+
+    result = conn.boards.client.execute(query)
+    if result.get("errors") or "data" not in result:
+        raise QueryError(result.get("errors") or result)
+
+    return result["data"]
+
+
+def columns_query(board_id) -> str:
+    """
+    The column definitions of a board.
+    """
+    return """query
+    {
+        boards(ids: [%s]) {
+            columns {
+                id
+                title
+                type
+                settings_str
+            }
+        }
+    }""" % (board_id,)
+
+
+def items_page_query(
+    board_id, limit: int, query_params: Optional[Dict] = None, fields: str = ITEM_FIELDS
+) -> str:
+    """
+    The first page of a board's items, with the cursor to the next.
+
+    `query_params` filters the items on the server, see `to_literal`.
+    """
+    arguments = f"limit: {limit}"
+    if query_params:
+        arguments += f", query_params: {to_literal(query_params)}"
+
+    return """query
+    {
+        boards(ids: [%s]) {
+            items_page(%s) {
+                cursor
+                items {%s}
+            }
+        }
+    }""" % (
+        board_id,
+        arguments,
+        fields,
+    )
+
+
+def items_page_by_column_values_query(
+    board_id, column_id: str, column_value: str, limit: int, fields: str = ITEM_FIELDS
+):
+    """
+    The first page of items whose column `column_id` equals `column_value`.
+    """
+    return """query
+    {
+        items_page_by_column_values(
+            board_id: %s,
+            limit: %d,
+            columns: [{column_id: %s, column_values: [%s]}]
+        ) {
+            cursor
+            items {%s}
+        }
+    }""" % (
+        board_id,
+        limit,
+        json.dumps(column_id),
+        json.dumps(column_value),
+        fields,
+    )
+
+
+def next_items_page_query(cursor: str, limit: int, fields: str = ITEM_FIELDS) -> str:
+    """
+    The page of items following `cursor`.
+    """
+    return """query
+    {
+        next_items_page(cursor: %s, limit: %d) {
+            cursor
+            items {%s}
+        }
+    }""" % (
+        json.dumps(cursor),
+        limit,
+        fields,
+    )
+
+
+def items_query(item_ids: List, fields: str = LINKED_ITEM_FIELDS) -> str:
+    """
+    The items with the given ids, from whichever boards they're on.
+    """
+    return """query
+    {
+        items(ids: %s, limit: %d) {%s}
+    }""" % (
+        to_literal([int(item_id) for item_id in item_ids]),
+        len(item_ids),
+        fields,
+    )
+
+
+def change_column_values_mutation(board_id, changes: Dict) -> str:
+    """
+    Change many items' column values in one request: an aliased
+    change_multiple_column_values per item in `changes`, item id to
+    the new values by column id.
+    """
+    mutations = "".join(
+        """
+        item_%d: change_multiple_column_values(board_id: %s, item_id: %d, column_values: %s) {
+            id
+        }""" % (int(item_id), board_id, int(item_id), json.dumps(json.dumps(column_values)))
+        for item_id, column_values in changes.items()
+    )
+
+    return "mutation\n    {%s\n    }" % (mutations,)
@@ -0,0 +1,233 @@
+# pylint: disable="missing-module-docstring"
+
+import asyncio
+import logging
+import math
+import random
+import re
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+import aiohttp
+from gql.transport.exceptions import TransportQueryError, TransportServerError
+
+logger = logging.getLogger(__name__)
+
+# selected on every query so the server reports what each one cost
+COMPLEXITY_FIELDS = "complexity { query after reset_in_x_seconds }"
+
+# error codes monday.com uses when a query is throttled rather than wrong
+THROTTLED_CODES = {
+    "ComplexityException",
+    "COMPLEXITY_BUDGET_EXHAUSTED",
+    "RATE_LIMIT_EXCEEDED",
+    "DAILY_LIMIT_EXCEEDED",
+    "maxConcurrencyExceeded",
+}
+
+
+def with_complexity(query: str) -> Tuple[str, bool]:
+    """
+    Add the complexity selection to a query or mutation, unless it already has one.
+
+    Returns the query and whether the selection was added.
+    """
+    if re.search(r"\bcomplexity\s*{", query):
+        return query, False
+
+    if not re.match(r"\s*(query|mutation|{)", query):
+        return query, False
+
+    index = query.find("{")
+    return f"{query[:index + 1]} {COMPLEXITY_FIELDS}{query[index + 1:]}", True
+
+
+def query_key(query: str) -> str:
+    """
+    The query with its string literals blanked, e.g. cursors, so that pages
+    of the same query share one cost estimate.
+    """
+    return re.sub(r'"(?:\\.|[^"\\])*"', '""', query)
+
+
+class ComplexityBudget:
+    """
+    A local copy of monday.com's per-minute complexity budget.
+
+    Each query reserves its estimated cost before it is sent, and `reserve`
+    says how long to wait until the budget can cover it. Reservations beyond
+    the current window are carried into the next ones, so queued queries go out
+    in order at the rate the budget allows. Once a query returns, `record`
+    settles the reservation with the cost the server reported.
+    """
+
+    # pylint: disable="too-many-instance-attributes"
+    def __init__(
+        self,
+        budget: int = 10_000_000,
+        window: float = 60.0,
+        default_cost: int = 10_000,
+        clock=time.monotonic,
+    ):
+
+        self.budget = budget
+        self.window = window
+        self.default_cost = default_cost
+        self.clock = clock
+
+        self.remaining = budget
+        self.reset_at = clock() + window
+        self.costs: Dict[str, int] = {}
+        self.queries = 0
+        self.throttled = 0
+
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+
+        if now >= self.reset_at:
+            windows = 1 + int((now - self.reset_at) // self.window)
+            self.remaining = min(self.budget, self.remaining + windows * self.budget)
+            self.reset_at += windows * self.window
+
+    def estimate(self, query: str) -> int:
+        """
+        The cost of the last query like this one, or the default.
+        """
+        return self.costs.get(query_key(query), self.default_cost)
+
+    def reserve(self, cost: int) -> float:
+        """
+        Take `cost` from the budget, returning the seconds to wait before sending.
+        """
+        with self._lock:
+            now = self.clock()
+            self._refill(now)
+            self.remaining -= cost
+            self.queries += 1
+
+            if self.remaining >= 0:
+                return 0.0
+
+            windows = math.ceil(-self.remaining / self.budget)
+            return (self.reset_at - now) + (windows - 1) * self.window
+
+    def release(self, cost: int):
+        """
+        Give back a reservation for a query that was not answered.
+        """
+        with self._lock:
+            self.remaining = min(self.budget, self.remaining + cost)
+
+    def record(self, query: str, reserved: int, complexity: Optional[Dict]):
+        """
+        Settle a reservation with the `complexity` reported for the query, if any.
+        """
+        if not complexity:
+            return
+
+        with self._lock:
+            cost = complexity.get("query")
+            if cost is not None:
+                self.costs[query_key(query)] = cost
+                self.remaining += reserved - cost
+
+            # the server's count wins when it has less left than we think
+            after = complexity.get("after")
+            if after is not None and after < self.remaining:
+                self.remaining = after
+
+            reset_in = complexity.get("reset_in_x_seconds")
+            if reset_in is not None:
+                self.reset_at = self.clock() + reset_in
+
+    def exhausted(self, reset_in: Optional[float] = None):
+        """
+        The server refused a query for lack of budget.
+        """
+        with self._lock:
+            self.throttled += 1
+            self.remaining = min(self.remaining, 0)
+            if reset_in is not None:
+                self.reset_at = self.clock() + reset_in
+
+    def state(self) -> Dict:
+        """
+        A snapshot of the budget, e.g. for logging.
+        """
+        with self._lock:
+            now = self.clock()
+            self._refill(now)
+            return {
+                "budget": self.budget,
+                "remaining": self.remaining,
+                "reset_in": max(0.0, self.reset_at - now),
+                "queries": self.queries,
+                "throttled": self.throttled,
+            }
+
+
+class RetryPolicy:
+    """
+    Retry throttled (429, complexity exhausted), 5xx and connection failures
+    with exponential backoff and full jitter, honouring any wait the server asks for.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        jitter=random.random,
+    ):
+
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Seconds to wait before retry number `attempt` (starting at 0).
+        """
+        backoff = self.jitter() * min(self.max_delay, self.base_delay * 2**attempt)
+        if retry_after:
+            return retry_after + backoff * 0.1
+        return backoff
+
+    @staticmethod
+    def classify(ex: BaseException, headers=None) -> Tuple[bool, bool, Optional[float]]:
+        """
+        Whether `ex` is worth retrying, whether it was the server throttling us,
+        and how long the server asked us to wait, if it said.
+        """
+        retry_after = None
+        if headers and headers.get("Retry-After"):
+            try:
+                retry_after = float(headers["Retry-After"])
+            except ValueError:
+                pass
+
+        if isinstance(ex, TransportServerError):
+            code = ex.code or 0
+            return code == 429 or code >= 500, code == 429, retry_after
+
+        if isinstance(ex, TransportQueryError):
+            for error in ex.errors or []:
+                extensions = error.get("extensions") or {}
+                message = error.get("message", "")
+                if extensions.get("code") in THROTTLED_CODES or "complexity budget" in (
+                    message.lower()
+                ):
+                    seconds = extensions.get("retry_in_seconds")
+                    if seconds is None:
+                        found = re.search(r"reset in (\d+) seconds", message)
+                        seconds = float(found.group(1)) if found else retry_after
+                    return True, True, seconds
+            return False, False, None
+
+        if isinstance(ex, (aiohttp.ClientError, asyncio.TimeoutError, OSError)):
+            return True, False, retry_after
+
+        return False, False, None
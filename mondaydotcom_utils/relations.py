@@ -0,0 +1,206 @@
+# pylint: disable="missing-module-docstring"
+
+import logging
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from mondaydotcom_utils import json_backend, queries
+from mondaydotcom_utils.edges import linked_pulse_ids
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# the most items monday.com returns for one items(ids: [...]) query
+MAX_BATCH_SIZE = 100
+
+
+class RelationResolver:
+    """
+    Looks up the items that board relations, dependencies and subitems link to.
+
+    Linked ids are fetched `batch_size` at a time with `items(ids: [...])`
+    queries, and kept in `index` (item id -> item) so that no id is fetched
+    twice, whichever board it was linked from. Pass the same `index` to several
+    resolvers, or reuse one resolver, to share it.
+    """
+
+    def __init__(
+        self,
+        conn,
+        batch_size: int = MAX_BATCH_SIZE,
+        fields: str = queries.LINKED_ITEM_FIELDS,
+        index: Optional[Dict[int, Optional[Dict]]] = None,
+    ):
+
+        self.conn = conn
+        self.batch_size = min(batch_size, MAX_BATCH_SIZE)
+        self.fields = fields
+
+        # None marks an id that was looked up but not found, e.g. a deleted item
+        self.index: Dict[int, Optional[Dict]] = {} if index is None else index
+
+    def fetch(self, item_ids: Iterable) -> Dict[int, Optional[Dict]]:
+        """
+        Look up every id in `item_ids` not already in the index. Returns the index.
+        """
+        missing = list(dict.fromkeys(int(item_id) for item_id in item_ids))
+        missing = [item_id for item_id in missing if item_id not in self.index]
+
+        for start in range(0, len(missing), self.batch_size):
+            batch = missing[start : start + self.batch_size]
+            items = queries.execute(self.conn, queries.items_query(batch, self.fields))["items"]
+
+            for item_id in batch:
+                self.index[item_id] = None
+            for item in items:
+                self.index[int(item["id"])] = item
+
+        logger.debug("Looked up %d linked items, %d at a time.", len(missing), self.batch_size)
+
+        return self.index
+
+    def lookup(self, item_id, attribute: str = "name"):
+        """
+        An attribute of an indexed item, or None if it wasn't found.
+        """
+        item = self.index.get(int(item_id))
+        return None if item is None else item.get(attribute)
+
+    def resolve(
+        self,
+        result_df: "pd.DataFrame",
+        columns: Sequence[str],
+        attributes: Sequence[str] = ("name",),
+    ) -> "pd.DataFrame":
+        """
+        Add a "<column>__<attribute>" column to a copy of `result_df` for each of
+        `columns`, lists of linked ids as `FormattedBoard` formats them, and each
+        of `attributes`, holding the linked items' attributes in the same order.
+
+        The linked ids of all the columns are looked up together.
+        """
+        self.fetch(
+            item_id
+            for column in columns
+            for item_ids in result_df[column]
+            if isinstance(item_ids, list)
+            for item_id in item_ids
+        )
+
+        result_df = result_df.copy()
+        for column in columns:
+            for attribute in attributes:
+                result_df[f"{column}__{attribute}"] = [
+                    self._lookup_all(item_ids, attribute) for item_ids in result_df[column]
+                ]
+
+        return result_df
+
+    def resolve_edges(
+        self, edges_df: "pd.DataFrame", attributes: Sequence[str] = ("name",)
+    ) -> "pd.DataFrame":
+        """
+        Add a column per attribute of the linked item to a copy of an edge table,
+        see `FormattedBoard.to_edges`.
+        """
+        target_ids = edges_df["target_id"].unique()
+        self.fetch(target_ids)
+
+        edges_df = edges_df.copy()
+        for attribute in attributes:
+            values = {item_id: self.lookup(item_id, attribute) for item_id in target_ids}
+            edges_df[attribute] = edges_df["target_id"].map(values)
+
+        return edges_df
+
+    def _lookup_all(self, item_ids, attribute: str) -> Optional[List]:
+
+        if not isinstance(item_ids, list):
+            return None
+
+        return [self.lookup(item_id, attribute) for item_id in item_ids]
+
+
+def subitem_ids(items, col_defs) -> Dict[int, List[int]]:
+    """
+    Each of `items`' id, and the ids of its subitems, read from the subitems column.
+    """
+    subtasks_ids = {col_id for col_id, col_def in col_defs.items() if col_def["type"] == "subtasks"}
+
+    children: Dict[int, List[int]] = {}
+    for item in items:
+        child_ids = []
+        for col in item["column_values"]:
+            if col["id"] in subtasks_ids and col["value"] is not None:
+                child_ids += linked_pulse_ids(json_backend.loads(col["value"]))
+        children[int(item["id"])] = child_ids
+
+    return children
+
+
+def _subitems_by_board(children, index) -> Dict[str, Tuple[List[Dict], List[int]]]:
+    """
+    The looked up subitems on each board they're on, and their parents' ids,
+    in the order of their parents.
+    """
+    by_board: Dict[str, Tuple[List[Dict], List[int]]] = {}
+    for parent_id, child_ids in children.items():
+        for child_id in child_ids:
+            child = index.get(child_id)
+            if child is None:
+                logger.warning("Subitem %s of item %s wasn't found.", child_id, parent_id)
+                continue
+            subitems, parent_ids = by_board.setdefault(child["board"]["id"], ([], []))
+            subitems.append(child)
+            parent_ids.append(parent_id)
+
+    return by_board
+
+
+def _format_subitems(conn, by_board, col_defs_cache=None) -> "pd.DataFrame":
+    """
+    Format the subitems of each board, see `_subitems_by_board`, with that board's
+    column definitions, adding their parents' ids as monday_parent_id.
+    """
+    # formatted_value imports this module, so it's imported when first needed
+    # pylint: disable="import-outside-toplevel, cyclic-import"
+    import pandas as pd
+
+    from mondaydotcom_utils.formatted_value import (
+        FormattedBoard,
+        concat_chunks,
+        get_col_defs,
+    )
+
+    chunks = []
+    for board_id, (subitems, parent_ids) in by_board.items():
+        col_defs = get_col_defs(conn, board_id, cache=col_defs_cache)
+        subitems_df = FormattedBoard(col_defs).load(subitems).to_df()
+        subitems_df.insert(2, "monday_parent_id", pd.array(parent_ids, dtype="Int64"))
+        chunks.append(subitems_df)
+
+    if not chunks:
+        subitems_df = FormattedBoard({}).load([]).to_df()
+        subitems_df.insert(2, "monday_parent_id", pd.array([], dtype="Int64"))
+        return subitems_df
+
+    return concat_chunks(chunks)
+
+
+def get_subitems(conn, items, col_defs, col_defs_cache=None, batch_size=MAX_BATCH_SIZE):
+    """
+    Fetch and format the subitems of `items`, unformatted items of the board
+    with the column definitions `col_defs`.
+
+    The subitems are looked up `batch_size` at a time and formatted with the
+    column definitions of their own board. Returns them as a dataframe, with
+    their parent's id as monday_parent_id, and a dict of each item's id to
+    the ids of its subitems.
+    """
+    children = subitem_ids(items, col_defs)
+    resolver = RelationResolver(conn, batch_size=batch_size, fields=queries.SUBITEM_FIELDS)
+    index = resolver.fetch(child_id for child_ids in children.values() for child_id in child_ids)
+
+    by_board = _subitems_by_board(children, index)
+    return _format_subitems(conn, by_board, col_defs_cache=col_defs_cache), children
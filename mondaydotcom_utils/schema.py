@@ -0,0 +1,69 @@
+# pylint: disable="missing-module-docstring"
+
+import logging
+import os
+from pathlib import Path
+from typing import Optional, Union
+
+from graphql import GraphQLSchema, build_ast_schema, parse, print_schema
+
+from mondaydotcom_utils import __version__
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_HEADER = "# mondaydotcom_utils schema snapshot"
+
+
+def schema_cache_dir() -> Path:
+    """
+    Where cached schema snapshots are kept, under the user's cache directory.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+    return Path(cache_home) / "mondaydotcom_utils"
+
+
+def schema_cache_path(api_version: Optional[str] = None) -> Path:
+    """
+    The cached snapshot for an API version, or for the server default when None.
+    """
+    return schema_cache_dir() / f"schema-{api_version or 'default'}.graphql"
+
+
+def snapshot_version(api_version: Optional[str] = None) -> str:
+    """
+    The version line a snapshot must carry to be used by this package and API version.
+    """
+    return f"{SNAPSHOT_HEADER}: package={__version__} api={api_version or 'default'}"
+
+
+def save_schema_snapshot(
+    schema: GraphQLSchema, path: Union[str, Path], api_version: Optional[str] = None
+):
+    """
+    Write `schema` to `path` as SDL, headed by its version line.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"{snapshot_version(api_version)}\n{print_schema(schema)}", encoding="UTF-8")
+    logger.debug("Saved schema snapshot to %s", path)
+
+
+def load_schema_snapshot(
+    path: Union[str, Path], api_version: Optional[str] = None, check_version: bool = True
+) -> Optional[GraphQLSchema]:
+    """
+    Build the schema saved at `path`.
+
+    Returns None if there is no snapshot, or, with `check_version`, if it was
+    saved by another package or API version.
+    """
+    path = Path(path)
+    if not path.is_file():
+        return None
+
+    sdl = path.read_text(encoding="UTF-8")
+    if check_version and sdl.split("\n", 1)[0] != snapshot_version(api_version):
+        logger.info("Ignoring schema snapshot %s saved for another version.", path)
+        return None
+
+    return build_ast_schema(parse(sdl))
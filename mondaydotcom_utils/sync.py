@@ -0,0 +1,177 @@
+# pylint: disable="missing-module-docstring"
+
+import json
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from mondaydotcom_utils import queries
+from mondaydotcom_utils.formatted_value import (
+    FormattedBoard,
+    concat_chunks,
+    get_col_defs,
+    iter_board_pages,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def load_snapshot(path: Union[str, Path]) -> Optional[Tuple[pd.DataFrame, Dict]]:
+    """
+    The formatted board and sync state saved under the directory `path`, if any.
+    """
+    path = Path(path)
+    if not (path / "state.json").is_file() or not (path / "items.json").is_file():
+        return None
+
+    state = json.loads((path / "state.json").read_text(encoding="UTF-8"))
+    result_df = pd.read_json(path / "items.json", orient="table")
+
+    # JSON keeps only nanosecond timestamps and reads text back with NaN for None
+    dtypes = json.loads((path / "dtypes.json").read_text(encoding="UTF-8"))
+    for key, dtype in dtypes.items():
+        if dtype == "object":
+            series = result_df[key].astype(object)
+            result_df[key] = series.where(series.notna(), None)
+        elif str(result_df[key].dtype) != dtype:
+            result_df[key] = result_df[key].astype(dtype)
+
+    return result_df, state
+
+
+def save_snapshot(path: Union[str, Path], result_df: pd.DataFrame, state: Dict):
+    """
+    Save a formatted board and its sync state under the directory `path`.
+
+    The board is saved as JSON, with its dtypes, so a snapshot can be read by
+    later versions of pandas. The state is written last, so an interrupted
+    save leaves the old watermark.
+    """
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+
+    result_df.to_json(path / "items.json", orient="table", index=False, date_unit="ns")
+    (path / "dtypes.json").write_text(
+        json.dumps({key: str(dtype) for key, dtype in result_df.dtypes.items()}), encoding="UTF-8"
+    )
+    (path / "state.json").write_text(json.dumps(state), encoding="UTF-8")
+
+
+def upsert_items(
+    snapshot_df: pd.DataFrame, changes_df: pd.DataFrame, current_ids: Optional[Iterable] = None
+) -> pd.DataFrame:
+    """
+    Replace the rows of `snapshot_df` that are in `changes_df`, by monday_id,
+    append the new ones, and, given `current_ids`, drop rows no longer on the board.
+
+    Updated rows keep their place; new rows go at the end.
+    """
+    unchanged_df = snapshot_df[~snapshot_df["monday_id"].isin(changes_df["monday_id"])]
+    result_df = concat_chunks([unchanged_df, changes_df])
+
+    position = pd.Series(np.arange(len(snapshot_df)), index=snapshot_df["monday_id"].to_numpy())
+    order = result_df["monday_id"].map(position).to_numpy(dtype=float, na_value=np.nan).copy()
+    new_rows = np.isnan(order)
+    order[new_rows] = len(snapshot_df) + np.arange(new_rows.sum())
+    result_df = result_df.iloc[np.argsort(order, kind="stable")]
+
+    if current_ids is not None:
+        result_df = result_df[result_df["monday_id"].isin(pd.Series(list(current_ids)).astype(int))]
+
+    return result_df.reset_index(drop=True)
+
+
+def parse_timestamp(value: str) -> datetime:
+    """
+    A monday.com timestamp, e.g. "2022-05-02T19:48:21Z", as an aware datetime.
+    """
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+# pylint: disable="too-many-arguments, too-many-locals"
+def sync_board(
+    conn,
+    board_id,
+    path: Union[str, Path],
+    page_size: int = 500,
+    col_defs: Optional[Dict] = None,
+    col_defs_cache=None,
+) -> pd.DataFrame:
+    """
+    Bring the formatted board saved under `path` up to date and return it.
+
+    The first sync fetches the whole board. Later ones fetch only the items
+    updated since the last sync's watermark, upsert them by monday_id, and drop
+    the items that are no longer on the board, which takes just their ids.
+    The new watermark is the time this sync started, so nothing updated while
+    it ran is missed next time.
+    """
+    started_at = datetime.now(timezone.utc)
+
+    if col_defs is None:
+        col_defs = get_col_defs(conn, board_id, cache=col_defs_cache)
+    formatted_board = FormattedBoard(col_defs)
+
+    snapshot = load_snapshot(path)
+    if snapshot is None or str(snapshot[1].get("board_id")) != str(board_id):
+        logger.info("No snapshot of board %s at %s, fetching all of it.", board_id, path)
+        chunks = [
+            formatted_board.load(items).to_df()
+            for items in iter_board_pages(conn, board_id, page_size=page_size)
+        ]
+        result_df = concat_chunks(chunks)
+    else:
+        snapshot_df, state = snapshot
+        watermark = parse_timestamp(state["watermark"])
+
+        # the server filters by day, so drop what was updated earlier that day
+        query_params = {
+            "rules": [
+                {
+                    "column_id": "__last_updated__",
+                    "compare_value": ["EXACT", watermark.date().isoformat()],
+                    "operator": queries.GraphQLEnum("greater_than_or_equals"),
+                    "compare_attribute": "UPDATED_AT",
+                }
+            ]
+        }
+        chunks = []
+        for items in iter_board_pages(
+            conn,
+            board_id,
+            page_size=page_size,
+            query_params=query_params,
+            fields=queries.UPDATED_ITEM_FIELDS,
+        ):
+            updated = [item for item in items if parse_timestamp(item["updated_at"]) >= watermark]
+            chunks.append(formatted_board.load(updated).to_df())
+        changes_df = concat_chunks(chunks)
+
+        current_ids = [
+            item["id"]
+            for items in iter_board_pages(
+                conn, board_id, page_size=page_size, fields=queries.ID_FIELDS
+            )
+            for item in items
+        ]
+
+        result_df = upsert_items(snapshot_df, changes_df, current_ids)
+        logger.info(
+            "Board %s: %d items updated since %s, %d items now.",
+            board_id,
+            len(changes_df),
+            state["watermark"],
+            len(result_df),
+        )
+
+    save_snapshot(
+        path,
+        result_df,
+        {"board_id": str(board_id), "watermark": started_at.isoformat().replace("+00:00", "Z")},
+    )
+
+    return result_df
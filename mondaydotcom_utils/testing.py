@@ -0,0 +1,150 @@
+# pylint: disable="missing-module-docstring"
+
+import json
+import re
+
+# stand-ins for the monday.com API, for tests and benchmarks that mustn't touch the network
+
+
+class StubMondayApi:
+    """
+    Answers column and items_page/next_items_page queries for `boards`,
+    a dict of board id to a board like the one in tests/resources/test_board.json.
+
+    Queries for `items(ids: [...])` are answered from all the boards.
+    Queries that select `complexity` are charged `cost` against `budget`, and
+    `column_values(ids: [...])` selects only those columns' values.
+    Mutations are recorded on `changes`.
+    """
+
+    def __init__(self, boards, cost=1000, budget=1_000_000):
+        self.boards = {str(board_id): board for board_id, board in boards.items()}
+        self.cost = cost
+        self.budget = budget
+        self.changes = []
+
+    def respond(self, query):
+        """
+        The JSON body to answer `query` with.
+        """
+        body = self.respond_data(query)
+        if re.search(r"\bcomplexity\s*{", query):
+            self.budget -= self.cost
+            body["data"]["complexity"] = {
+                "query": self.cost,
+                "after": self.budget,
+                "reset_in_x_seconds": 30,
+            }
+        return body
+
+    def respond_data(self, query):
+        # pylint: disable="missing-function-docstring"
+        if query.lstrip().startswith("mutation"):
+            return self.mutate(query)
+
+        column_ids = re.search(r"column_values\(ids: (\[.*?\])\)", query)
+        if column_ids:
+            column_ids = json.loads(column_ids.group(1))
+
+        if "next_items_page" in query:
+            board_id, start = re.search(r'cursor: "(\d+):(\d+)"', query).groups()
+            limit = int(re.search(r"limit: (\d+)", query).group(1))
+            items_page = self.items_page(board_id, int(start), limit, column_ids)
+            return {"data": {"next_items_page": items_page}}
+
+        if re.search(r"\bitems\(ids:", query):
+            item_ids = json.loads(re.search(r"items\(ids: (\[.*?\])", query).group(1))
+            items = [
+                dict(item, board={"id": board_id})
+                for board_id, board in self.boards.items()
+                for item in board["items"]
+                if int(item["id"]) in item_ids
+            ]
+            return {"data": {"items": items}}
+
+        board_id = re.search(r"boards\(ids: \[(\d+)\]", query).group(1)
+        if "items_page" in query:
+            limit = int(re.search(r"limit: (\d+)", query).group(1))
+            items_page = self.items_page(board_id, 0, limit, column_ids)
+            return {"data": {"boards": [{"items_page": items_page}]}}
+
+        return {"data": {"boards": [{"columns": self.boards[board_id]["columns"]}]}}
+
+    def mutate(self, query):
+        """
+        Record the change_multiple_column_values mutations in `query` on `changes`,
+        as (board id, item id, column values).
+        """
+        data = {}
+        for alias, board_id, item_id, column_values in re.findall(
+            r"(\w+): change_multiple_column_values\(board_id: (\d+), item_id: (\d+), "
+            r'column_values: ("(?:\\.|[^"\\])*")\)',
+            query,
+        ):
+            self.changes.append(
+                (int(board_id), int(item_id), json.loads(json.loads(column_values)))
+            )
+            data[alias] = {"id": item_id}
+        return {"data": data}
+
+    def items_page(self, board_id, start, limit, column_ids=None):
+        # pylint: disable="missing-function-docstring"
+        items = self.boards[board_id]["items"]
+        end = start + limit
+        cursor = f"{board_id}:{end}" if end < len(items) else None
+
+        items = items[start:end]
+        if column_ids is not None:
+            items = [
+                dict(
+                    item,
+                    column_values=[
+                        value for value in item["column_values"] if value["id"] in column_ids
+                    ],
+                )
+                for item in items
+            ]
+        return {"cursor": cursor, "items": items}
+
+
+# pylint: disable="too-few-public-methods"
+class FakeMondayClient:
+    """
+    A stand-in for the monday SDK's MondayClient, answering from a StubMondayApi
+    and recording the calls made on it.
+    """
+
+    class Resource:
+        # pylint: disable="missing-class-docstring"
+        def __init__(self, owner):
+            self.owner = owner
+            self.client = self
+
+        def execute(self, query):
+            # pylint: disable="missing-function-docstring"
+            self.owner.calls.append(("execute", query))
+            return self.owner.api.respond(query)
+
+        def fetch_boards_by_id(self, board_id):
+            # pylint: disable="missing-function-docstring"
+            self.owner.calls.append(("fetch_boards_by_id", board_id))
+            board = self.owner.api.boards[str(board_id)]
+            return {"data": {"boards": [{"columns": board["columns"]}]}}
+
+        def fetch_items_by_board_id(self, board_id):
+            # pylint: disable="missing-function-docstring"
+            self.owner.calls.append(("fetch_items_by_board_id", board_id))
+            board = self.owner.api.boards[str(board_id)]
+            return {"data": {"boards": [{"items": board["items"]}]}}
+
+    def __init__(self, boards):
+        self.api = StubMondayApi(boards)
+        self.calls = []
+        self.boards = self.Resource(self)
+        self.items = self.Resource(self)
+
+    def count(self, name):
+        """
+        How many times the `name` method was called.
+        """
+        return sum(1 for call, _ in self.calls if call == name)
@@ -0,0 +1,232 @@
+# pylint: disable="missing-module-docstring"
+
+import json
+import logging
+import threading
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from mondaydotcom_utils.formatted_value import FormattedBoard
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def _changed_at(event: Dict) -> Optional[str]:
+    changed_at = event.get("changedAt")
+    if changed_at is None:
+        return None
+    moment = datetime.fromtimestamp(float(changed_at), tz=timezone.utc)
+    return moment.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def to_cell(column_type: str, value, changed_at: Optional[str] = None) -> Tuple:
+    """
+    A webhook's column value as the (value, text) of a cell from the API,
+    with the value already decoded, as the column's formatter expects it.
+    """
+    # pylint: disable="too-many-return-statements"
+    if value is None:
+        return None, ""
+
+    if column_type == "color":
+        label = value.get("label") or {}
+        decoded = {"index": label.get("index"), "post_id": value.get("post_id")}
+        if changed_at:
+            decoded["changed_at"] = changed_at
+        return decoded, label.get("text") or ""
+    if column_type in ("text", "numeric"):
+        text = "" if value.get("value") is None else str(value["value"])
+        return text, text
+    if column_type == "date":
+        text = " ".join(part for part in (value.get("date"), value.get("time")) if part)
+        return {"date": value.get("date"), "changed_at": changed_at}, text
+    if column_type == "dropdown":
+        chosen = value.get("chosenValues") or []
+        return {"ids": [label["id"] for label in chosen]}, ", ".join(
+            label["name"] for label in chosen
+        )
+    if column_type == "boolean":
+        if not value.get("checked"):
+            return None, ""
+        return {"checked": "true", "changed_at": changed_at}, "v"
+
+    # the rest arrive much as the API holds them, e.g. linkedPulseIds or tag_ids
+    if isinstance(value, dict) and changed_at and column_type not in ("tag", "subtasks"):
+        value = dict(value, changed_at=changed_at)
+    return value, ""
+
+
+class LiveBoard:
+    """
+    A formatted board kept up to date in memory by monday.com webhook events
+    (see `apply`), rather than by fetching it again.
+
+    Rows are found by item id through an index, so an event costs the same
+    however big the board is. Deleted items are dropped when the dataframe
+    is built by `to_df`.
+    """
+
+    def __init__(self, col_defs: Dict, items: Optional[List[Dict]] = None, board_id=None):
+
+        self.board_id = None if board_id is None else str(board_id)
+        self.board = FormattedBoard(col_defs).load(items or [])
+        self.index: Dict[int, int] = {
+            int(item_id): row for row, item_id in enumerate(self.board.buffers.buffers["monday_id"])
+        }
+        self.deleted: List[int] = []
+        self._lock = threading.Lock()
+
+    def apply(self, event: Dict) -> bool:
+        """
+        Apply one webhook event, or the body it came in, to the board.
+
+        Handles column value and name updates and item creation and deletion.
+        Returns False for events it ignores, e.g. for another board.
+        """
+        event = event.get("event", event)
+        if self.board_id is not None and str(event.get("boardId")) != self.board_id:
+            return False
+
+        event_type = event.get("type")
+        with self._lock:
+            if event_type == "update_column_value":
+                row = self._row(event)
+                self._set_cell(row, event["columnId"], event.get("value"), _changed_at(event))
+            elif event_type == "update_name":
+                row = self._row(event)
+                self.board.buffers.buffers["monday_name"][row] = (event.get("value") or {}).get(
+                    "name"
+                )
+            elif event_type == "create_pulse":
+                row = self._row(event)
+                for column_id, value in (event.get("columnValues") or {}).items():
+                    self._set_cell(row, column_id, value, _changed_at(event))
+            elif event_type in ("delete_pulse", "item_deleted"):
+                item_id = int(event.get("itemId") or event["pulseId"])
+                if item_id in self.index:
+                    self.deleted.append(self.index.pop(item_id))
+            else:
+                logger.debug("Ignoring webhook event %s", event_type)
+                return False
+
+        return True
+
+    def _row(self, event: Dict) -> int:
+        """
+        The row of the event's item, added if the board doesn't have it yet.
+        """
+        item_id = int(event["pulseId"])
+        row = self.index.get(item_id)
+        if row is None:
+            buffers = self.board.buffers
+            row = self.index[item_id] = buffers.grow(1)
+            buffers.buffers["monday_id"][row] = str(item_id)
+            buffers.buffers["monday_name"][row] = event.get("pulseName")
+
+        return row
+
+    def _set_cell(self, row: int, column_id: str, value, changed_at: Optional[str]):
+
+        column = self.board.columns.get(column_id)
+        if column is None:
+            logger.warning("Ignoring a value for column %s, which isn't on the board.", column_id)
+            return
+
+        value, text = to_cell(column.column_type, value, changed_at)
+        if value is not None and not column.decode and not isinstance(value, str):
+            value = json.dumps(value)
+
+        # clear what the cell held before; its new value may not set every key
+        buffers = self.board.buffers
+        buffers.set(row, {key: None for key, _ in column.schema})
+        buffers.set(row, column.formatter(column, value, text))
+
+    def to_df(self) -> "pd.DataFrame":
+        """
+        The board as it stands, as a dataframe.
+        """
+        with self._lock:
+            result_df = self.board.to_df()
+            if self.deleted:
+                result_df = result_df.drop(index=self.deleted).reset_index(drop=True)
+
+        return result_df
+
+
+class WebhookReceiver:
+    """
+    A small HTTP server, on its own thread, that applies the webhook events
+    POSTed to it to a `LiveBoard`, and answers monday.com's challenge.
+
+        with WebhookReceiver(live_board, port=8080) as receiver:
+            ...
+    """
+
+    def __init__(self, live_board: LiveBoard, host: str = "127.0.0.1", port: int = 0):
+
+        self.live_board = live_board
+        self.server = ThreadingHTTPServer((host, port), self._handler())
+        self.url = f"http://{host}:{self.server.server_address[1]}/"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def _handler(self):
+
+        live_board = self.live_board
+
+        class Handler(BaseHTTPRequestHandler):
+            """
+            Applies each webhook event posted to it to the live board.
+            """
+
+            # pylint: disable="invalid-name, missing-function-docstring"
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                try:
+                    body = json.loads(self.rfile.read(length) or b"{}")
+                except ValueError:
+                    self.send_error(400, "Expected a JSON body")
+                    return
+
+                # monday.com checks a new webhook URL by asking it to echo a challenge
+                if "challenge" in body:
+                    answer = {"challenge": body["challenge"]}
+                else:
+                    live_board.apply(body)
+                    answer = {}
+
+                payload = json.dumps(answer).encode("UTF-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):  # pylint: disable="redefined-builtin"
+                logger.debug(format, *args)
+
+        return Handler
+
+    def start(self):
+        """
+        Start serving on the background thread.
+        """
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stop serving and close the socket.
+        """
+        self.server.shutdown()
+        self.server.server_close()
+        self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -0,0 +1,227 @@
+# pylint: disable="missing-module-docstring"
+
+import functools
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from mondaydotcom_utils import queries
+from mondaydotcom_utils.formatted_value import FormattedValue, get_col_defs
+
+logger = logging.getLogger(__name__)
+
+
+def _is_missing(value) -> bool:
+    if value is None:
+        return True
+    if isinstance(value, (list, dict, str)):
+        return False
+    return bool(pd.isna(value))
+
+
+def _same(original, edited) -> bool:
+    if _is_missing(original) or _is_missing(edited):
+        return _is_missing(original) and _is_missing(edited)
+    return bool(original == edited)
+
+
+def encode_text(value):
+    # pylint: disable="missing-function-docstring"
+    return "" if _is_missing(value) else str(value)
+
+
+def encode_numeric(value):
+    # pylint: disable="missing-function-docstring"
+    if _is_missing(value):
+        return ""
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def encode_date(value, timezone: Optional[str] = None):
+    """
+    A date, or a date and time, which monday.com keeps in UTC. A naive time of day
+    is taken to be in `timezone`, e.g. "America/New_York"; without one it's ambiguous
+    and raises ValueError. Naive dates without a time are written as they are.
+    """
+    if _is_missing(value):
+        return {}
+
+    timestamp = pd.Timestamp(value)
+    if timestamp.tzinfo is None and timestamp != timestamp.normalize():
+        if timezone is None:
+            raise ValueError(
+                f"Can't tell which timezone {timestamp} is in; make it tz-aware or pass timezone"
+            )
+        timestamp = timestamp.tz_localize(timezone)
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.tz_convert("UTC")
+    date = {"date": timestamp.strftime("%Y-%m-%d")}
+    if timestamp != timestamp.normalize():
+        date["time"] = timestamp.strftime("%H:%M:%S")
+    return date
+
+
+def encode_long_text(value):
+    # pylint: disable="missing-function-docstring"
+    return {} if _is_missing(value) else {"text": str(value)}
+
+
+def encode_color(value):
+    # pylint: disable="missing-function-docstring"
+    return {} if _is_missing(value) else {"label": str(value)}
+
+
+def encode_dropdown(value):
+    # pylint: disable="missing-function-docstring"
+    if _is_missing(value):
+        return {}
+    return {"labels": [label.strip() for label in str(value).split(",") if label.strip()]}
+
+
+def encode_tag(value):
+    # pylint: disable="missing-function-docstring"
+    return {} if _is_missing(value) else {"tag_ids": [int(tag_id) for tag_id in value]}
+
+
+def encode_person(value):
+    # pylint: disable="missing-function-docstring"
+    return {} if _is_missing(value) else {"personsAndTeams": list(value)}
+
+
+def encode_linked(value):
+    # pylint: disable="missing-function-docstring"
+    return {} if _is_missing(value) else {"item_ids": [int(item_id) for item_id in value]}
+
+
+def encode_boolean(value):
+    # pylint: disable="missing-function-docstring"
+    return {"checked": "true"} if not _is_missing(value) and value else {}
+
+
+def encode_timerange(from_value, to_value):
+    # pylint: disable="missing-function-docstring"
+    if _is_missing(from_value) or _is_missing(to_value):
+        return {}
+    return {
+        "from": pd.Timestamp(from_value).strftime("%Y-%m-%d"),
+        "to": pd.Timestamp(to_value).strftime("%Y-%m-%d"),
+    }
+
+
+# the writable column types: the output key suffix holding the value, and how to write it back
+TYPE_TO_ENCODER_MAP: Dict[str, Tuple[Optional[str], Callable[[Any], Any]]] = {
+    "text": (None, encode_text),
+    "numeric": (None, encode_numeric),
+    "date": (None, encode_date),
+    "long-text": (None, encode_long_text),
+    "color": ("text", encode_color),
+    "dropdown": (None, encode_dropdown),
+    "tag": (None, encode_tag),
+    "multiple-person": (None, encode_person),
+    "board-relation": (None, encode_linked),
+    "dependency": (None, encode_linked),
+    "boolean": ("checked", encode_boolean),
+}
+
+
+def diff_changes(
+    original_df: pd.DataFrame,
+    edited_df: pd.DataFrame,
+    col_defs: Dict,
+    timezone: Optional[str] = None,
+) -> Dict[int, Dict[str, Any]]:
+    """
+    The changes made to `original_df`, as formatted by `get_items_by_board`, in
+    `edited_df`: a dict of item id to the changed column values, by column id,
+    encoded as `change_multiple_column_values` expects them.
+
+    Only items in both frames are compared. Metadata such as "__changed_at"
+    is ignored; changes to columns that can't be written, e.g. formulas,
+    raise ValueError. Naive dates with a time are in `timezone`, see `encode_date`.
+    """
+    original_df = original_df.set_index("monday_id")
+    edited_df = edited_df.set_index("monday_id")
+
+    added = edited_df.index.difference(original_df.index)
+    if len(added):
+        logger.warning("Ignoring %d items that aren't in the original.", len(added))
+    item_ids = edited_df.index.intersection(original_df.index)
+    original_df = original_df.loc[item_ids]
+    edited_df = edited_df.loc[item_ids]
+
+    def changed(key) -> List:
+        if key not in edited_df.columns or key not in original_df.columns:
+            return []
+        return [
+            item_id
+            for item_id, original, edited in zip(item_ids, original_df[key], edited_df[key])
+            if not _same(original, edited)
+        ]
+
+    changes: Dict[int, Dict[str, Any]] = {}
+
+    for item_id in changed("monday_name"):
+        changes.setdefault(int(item_id), {})["name"] = str(edited_df.at[item_id, "monday_name"])
+
+    for column in FormattedValue(col_defs).columns.values():
+        if column.column_type == "name":
+            continue
+
+        if column.column_type == "timerange":
+            from_key, to_key = column.key("from"), column.key("to")
+            for item_id in dict.fromkeys(changed(from_key) + changed(to_key)):
+                changes.setdefault(int(item_id), {})[column.column_id] = encode_timerange(
+                    edited_df.at[item_id, from_key], edited_df.at[item_id, to_key]
+                )
+            continue
+
+        if column.column_type not in TYPE_TO_ENCODER_MAP:
+            for key, _ in column.schema:
+                if not key.endswith("__changed_at") and changed(key):
+                    raise ValueError(f"Column {column.title!r} ({column.column_type}) is read-only")
+            continue
+
+        suffix, encoder = TYPE_TO_ENCODER_MAP[column.column_type]
+        if column.column_type == "date":
+            encoder = functools.partial(encode_date, timezone=timezone)
+        key = column.title if suffix is None else column.key(suffix)
+        for item_id in changed(key):
+            changes.setdefault(int(item_id), {})[column.column_id] = encoder(
+                edited_df.at[item_id, key]
+            )
+
+    return changes
+
+
+# pylint: disable="too-many-arguments"
+def write_back(
+    conn,
+    board_id,
+    original_df: pd.DataFrame,
+    edited_df: pd.DataFrame,
+    col_defs: Optional[Dict] = None,
+    batch_size: int = 50,
+    col_defs_cache=None,
+    timezone: Optional[str] = None,
+) -> Dict[int, Dict[str, Any]]:
+    """
+    Write the changes made to a board's items, from `original_df` to `edited_df`
+    (see `diff_changes`), back to monday.com.
+
+    The changed columns of `batch_size` items are sent in each request, as
+    aliased `change_multiple_column_values` mutations. Returns the changes.
+    """
+    if col_defs is None:
+        col_defs = get_col_defs(conn, board_id, cache=col_defs_cache)
+
+    changes = diff_changes(original_df, edited_df, col_defs, timezone=timezone)
+    item_ids = list(changes)
+
+    for start in range(0, len(item_ids), batch_size):
+        batch = {item_id: changes[item_id] for item_id in item_ids[start : start + batch_size]}
+        queries.execute(conn, queries.change_column_values_mutation(board_id, batch))
+
+    logger.info("Wrote changes to %d items of board %s.", len(item_ids), board_id)
+
+    return changes
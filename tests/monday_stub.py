@@ -0,0 +1,111 @@
+# pylint: disable="missing-module-docstring"
+import asyncio
+import json
+import os
+import threading
+from pathlib import Path
+
+from aiohttp import web
+
+from mondaydotcom_utils.graphql import MondayDotComClient
+from mondaydotcom_utils.testing import StubMondayApi
+
+
+# pylint: disable="too-few-public-methods"
+class FakeClock:
+    """
+    A stand-in clock that only moves when `now` is set.
+    """
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def stub_client(server, **kwargs):
+    """
+    A client pointed at the stub, which has no schema to introspect.
+    """
+    return MondayDotComClient(url=server.url, monday_key="test", schema="none", **kwargs)
+
+
+def load_board():
+    """
+    The board from tests/resources/test_board.json.
+    """
+    current_path = Path(os.path.dirname(os.path.realpath(__file__)))
+
+    with open(
+        os.path.join(current_path, "resources", "test_board.json"), "r", encoding="UTF-8"
+    ) as file_handle:
+        return json.load(file_handle)["data"]["boards"][0]
+
+
+class StubMondayServer(StubMondayApi):
+    """
+    A local stand-in for the monday.com GraphQL endpoint, run on its own thread.
+
+    `delay` is how long each request takes, so concurrency can be observed.
+    Responses queued on `failures`, as (status, body, headers), are sent first.
+    The sizes of the bodies of the other responses are kept in `response_bytes`.
+    """
+
+    # pylint: disable="too-many-instance-attributes"
+    def __init__(self, boards, delay=0.0, **kwargs):
+        super().__init__(boards, **kwargs)
+        self.delay = delay
+        self.failures = []
+        self.requests = []
+        self.response_bytes = []
+        self.peers = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.url = None
+
+        self._loop = asyncio.new_event_loop()
+        self._runner = None
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+
+    async def handle(self, request):
+        # pylint: disable="missing-function-docstring"
+        payload = await request.json()
+        self.requests.append(payload)
+        self.peers.add(request.transport.get_extra_info("peername"))
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.failures:
+                status, body, headers = self.failures.pop(0)
+                if isinstance(body, str):
+                    return web.Response(status=status, text=body, headers=headers)
+                return web.json_response(body, status=status, headers=headers)
+            response = web.json_response(self.respond(payload["query"]))
+            self.response_bytes.append(len(response.body))
+            return response
+        finally:
+            self.in_flight -= 1
+
+    async def _start(self):
+        app = web.Application()
+        app.router.add_post("/v2", self.handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]  # pylint: disable="protected-access"
+        self.url = f"http://127.0.0.1:{port}/v2"
+
+    def __enter__(self):
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._start(), self._loop).result()
+        return self
+
+    def __exit__(self, *exc_info):
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
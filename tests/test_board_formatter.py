@@ -3,7 +3,12 @@ import json
 import os
 from pathlib import Path
 
-from mondaydotcom_utils.formatted_value import FormattedBoard
+import pandas as pd
+
+from mondaydotcom_utils.buffers import convert_column
+from mondaydotcom_utils.edges import EdgeTable, people
+from mondaydotcom_utils.formatted_value import FormattedBoard, to_col_defs
+from tests.monday_stub import load_board
 
 
 # pylint: disable="missing-function-docstring"
@@ -28,19 +33,26 @@ def test_board_formatter():
         col_defs = json.load(file_handle)
 
     board_formatter = FormattedBoard(col_defs)
-    board_formatter.format(items)
+    rows = board_formatter.format(items)
+
+    # format still returns the rows as dicts, as it always has
+    assert isinstance(rows, list) and len(rows) == len(items)
+    assert rows[0]["monday_id"] == items[0]["id"]
+
+    result_df = board_formatter.to_df()
 
-    assert board_formatter.to_df().columns.to_list() == [
+    # the schema follows the column definitions, whatever values the items hold
+    assert result_df.columns.to_list() == [
         "monday_id",
         "monday_name",
-        "Subitems",
         "Person",
         "Status__text",
         "Status__changed_at",
         "Date",
-        "Timeline__to",
         "Timeline__from",
+        "Timeline__to",
         "Timeline__changed_at",
+        "Timeline__visualization_type",
         "Timeline Days",
         "Another Status__text",
         "Another Status__changed_at",
@@ -60,11 +72,98 @@ def test_board_formatter():
         "A Mirror Column__mirror",
         "Tags",
         "Long Notes",
+        "Subitems",
         "Check__checked",
         "Check__changed_at",
-        "Timeline__visualization_type",
-        "Timeline",
-        "Time Tracking",
-        "Status",
-        "Another Status",
     ]
+
+    assert str(result_df["monday_id"].dtype) == "Int64"
+    assert str(result_df["Timeline Days"].dtype) == "Int64"
+    assert str(result_df["Check__checked"].dtype) == "boolean"
+    assert str(result_df["Status__text"].dtype) == "category"
+    assert result_df["Date"].dtype.kind == "M"
+    assert result_df["Timeline__from"].dtype.kind == "M"
+    assert str(result_df["Status__changed_at"].dt.tz) == "UTC"
+    assert str(result_df["Time Tracking__startDate"].dt.tz) == "UTC"
+
+
+def test_convert_column():
+
+    assert convert_column(["4", "", None, "12"], "numeric").to_list() == [4, pd.NA, pd.NA, 12]
+    assert str(convert_column(["2.5", "", "1"], "numeric").dtype) == "Float64"
+
+    dates = convert_column(["2022-05-02", None, "2022-05-05 10:30"], "date")
+    assert dates.to_list()[::2] == [pd.Timestamp("2022-05-02"), pd.Timestamp("2022-05-05 10:30")]
+    assert dates.isna().to_list() == [False, True, False]
+
+    timestamps = convert_column(["2022-05-02T19:48:21.426Z"], "timestamp")
+    assert timestamps[0] == pd.Timestamp("2022-05-02T19:48:21.426", tz="UTC")
+
+    assert convert_column([1651520901, None], "epoch")[0] == pd.Timestamp(
+        "2022-05-02T19:48:21", tz="UTC"
+    )
+
+
+def test_board_formatter_edges():
+
+    board = load_board()
+    formatted_board = FormattedBoard(to_col_defs(board["columns"]), edges=True)
+    result_df = formatted_board.load(board["items"]).to_df()
+    edges = formatted_board.to_edges()
+
+    assert list(edges) == ["Subitems", "Person", "Dependency", "Test Board", "Tags"]
+    assert not set(edges) & set(result_df.columns)
+
+    dependency_df = edges["Dependency"]
+    assert dependency_df.index.name == "monday_id"
+    assert str(dependency_df["target_id"].dtype) == "int64"
+    assert dependency_df["target_id"].to_list() == [2619086253, 2619086190, 2619086190]
+
+    # people columns hold both person and team ids, so their kind is kept
+    person_df = edges["Person"]
+    assert person_df.columns.to_list() == ["target_id", "kind"]
+    assert person_df["kind"].to_list() == ["person"] * len(person_df)
+    assert "kind" not in edges["Tags"].columns
+
+    value = {"personsAndTeams": [{"id": 1, "kind": "person"}, {"id": 1, "kind": "team"}]}
+    assert people(value) == [(1, "person"), (1, "team")]
+
+    first_id = int(board["items"][0]["id"])
+    assert edges["Tags"].loc[[first_id], "target_id"].to_list() == [14429933, 14429935]
+
+    # the links join back onto the items by monday_id
+    joined_df = result_df.merge(edges["Test Board"], left_on="monday_id", right_index=True)
+    assert len(joined_df) == 3
+
+
+def test_edge_table_merges_kinds():
+
+    edges = EdgeTable(kinds=True)
+    edges.add(1, [(5, "person"), (6, "team")])
+    shard = EdgeTable(kinds=True)
+    shard.add(2, [(5, "person")])
+    edges.extend(shard.sources, shard.targets, shard.kinds)
+
+    edges_df = edges.to_df()
+    assert edges_df.index.to_list() == [1, 1, 2]
+    assert edges_df["target_id"].to_list() == [5, 6, 5]
+    assert edges_df["kind"].to_list() == ["person", "team", "person"]
+
+
+def test_board_formatter_parallel():
+
+    board = load_board()
+    col_defs = to_col_defs(board["columns"])
+    items = board["items"] * 3
+
+    expected_df = FormattedBoard(col_defs).load(items).to_df()
+    result_df = FormattedBoard(col_defs).format_parallel(items, workers=2, chunk_size=4).to_df()
+
+    assert result_df.columns.to_list() == expected_df.columns.to_list()
+    assert result_df.dtypes.to_list() == expected_df.dtypes.to_list()
+    assert result_df.equals(expected_df)
+
+    formatted_board = FormattedBoard(col_defs, edges=True)
+    expected_edges = formatted_board.load(items).to_edges()
+    result_edges = formatted_board.format_parallel(items, workers=2, chunk_size=4).to_edges()
+    assert all(result_edges[title].equals(expected_edges[title]) for title in expected_edges)
@@ -0,0 +1,69 @@
+# pylint: disable="missing-module-docstring"
+import copy
+
+from mondaydotcom_utils.cache import TTLCache
+from mondaydotcom_utils.formatted_value import get_col_defs, get_items_by_board
+from mondaydotcom_utils.testing import FakeMondayClient
+from tests.monday_stub import FakeClock, load_board
+
+
+# pylint: disable="missing-function-docstring"
+def test_ttl_cache_expires_and_evicts():
+
+    clock = FakeClock(1000.0)
+    cache = TTLCache(maxsize=2, ttl=60, clock=clock)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    # "b" is now the least recently used
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+    clock.now += 61
+    assert cache.get("a") is None
+
+
+def test_ttl_cache_on_disk(tmp_path):
+
+    clock = FakeClock(1000.0)
+    TTLCache(directory=tmp_path, clock=clock).set("123", {"status": {"title": "Status"}})
+
+    cache = TTLCache(directory=tmp_path, clock=clock)
+    assert cache.get("123") == {"status": {"title": "Status"}}
+
+    cache.invalidate("123")
+    assert TTLCache(directory=tmp_path, clock=clock).get("123") is None
+
+
+def test_get_col_defs_cached():
+
+    conn = FakeMondayClient({123: load_board()})
+    cache = TTLCache()
+
+    col_defs = get_col_defs(conn, 123, cache=cache)
+    assert get_col_defs(conn, 123, cache=cache) == col_defs
+    assert conn.count("fetch_boards_by_id") == 1
+
+    get_items_by_board(conn, 123, col_defs_cache=cache)
+    assert conn.count("fetch_boards_by_id") == 1
+
+
+def test_stale_col_defs_refetched():
+
+    board = load_board()
+    conn = FakeMondayClient({123: board})
+    cache = TTLCache()
+
+    # cached before the board gained its "check" column
+    stale_board = copy.deepcopy(board)
+    stale_board["columns"] = [column for column in board["columns"] if column["id"] != "check"]
+    cache.set("123", get_col_defs(FakeMondayClient({123: stale_board}), 123))
+
+    result_df = get_items_by_board(conn, 123, col_defs_cache=cache)
+
+    assert "Check__checked" in result_df.columns
+    assert conn.count("fetch_boards_by_id") == 1
+    assert "check" in cache.get("123")
@@ -0,0 +1,58 @@
+# pylint: disable="missing-module-docstring"
+import pytest
+
+from mondaydotcom_utils.formatted_value import (
+    FormattedBoard,
+    get_items_by_board,
+    resolve_columns,
+    to_col_defs,
+)
+from mondaydotcom_utils.testing import FakeMondayClient
+from tests.monday_stub import load_board
+
+
+# pylint: disable="missing-function-docstring"
+def test_resolve_columns():
+
+    col_defs = to_col_defs(load_board()["columns"])
+
+    assert resolve_columns(col_defs, ["status", "Timeline Days", "Status"]) == [
+        "status",
+        "numbers",
+    ]
+    with pytest.raises(ValueError):
+        resolve_columns(col_defs, ["No Such Column"])
+
+
+def test_formatted_board_skips_other_columns():
+
+    board = load_board()
+    formatted_board = FormattedBoard(to_col_defs(board["columns"]), columns=["status", "Date"])
+    result_df = formatted_board.load(board["items"]).to_df()
+
+    assert result_df.columns.to_list() == [
+        "monday_id",
+        "monday_name",
+        "Status__text",
+        "Status__changed_at",
+        "Date",
+    ]
+    assert len(result_df) == len(board["items"])
+
+
+def test_get_items_by_board_projects_columns():
+
+    board = load_board()
+    conn = FakeMondayClient({123: board})
+
+    result_df = get_items_by_board(conn, 123, columns=["status", "Timeline Days"])
+
+    # the values of other columns are never fetched
+    query = conn.calls[-1][1]
+    assert 'column_values(ids: ["status", "numbers"])' in query
+    assert conn.count("fetch_items_by_board_id") == 0
+
+    full_df = get_items_by_board(conn, 123)
+    for column in result_df.columns:
+        assert result_df[column].equals(full_df[column])
+    assert "Notes" not in result_df.columns
@@ -0,0 +1,84 @@
+# pylint: disable="missing-module-docstring"
+import asyncio
+import copy
+
+import pytest
+from gql import gql
+
+from mondaydotcom_utils.graphql import MondayDotComClient, PooledAIOHTTPTransport
+from tests.monday_stub import StubMondayServer, load_board, stub_client
+
+
+# pylint: disable="missing-function-docstring"
+def test_fetch_boards_concurrently():
+
+    board = load_board()
+    other_board = copy.deepcopy(board)
+    other_board["items"] = other_board["items"][:3]
+    boards = {1: board, 2: other_board, 3: board, 4: other_board}
+
+    with StubMondayServer(boards, delay=0.05) as server:
+        client = stub_client(server)
+        results = client.fetch_boards(boards, max_concurrency=3, page_size=2)
+
+    assert list(results) == [1, 2, 3, 4]
+    assert [len(result_df) for result_df in results.values()] == [5, 3, 5, 3]
+    assert results[1]["monday_id"].to_list() == [int(item["id"]) for item in board["items"]]
+
+    # 4 column queries plus 3 pages for each big board and 2 for each small one
+    assert len(server.requests) == 4 + 3 + 2 + 3 + 2
+    assert 1 < server.max_in_flight <= 3
+
+
+def test_session_reuses_connection():
+
+    query = "query { boards(ids: [1]) { columns { id } } }"
+
+    with StubMondayServer({1: load_board()}) as server:
+        client = stub_client(server)
+        for _ in range(3):
+            client.query(query, {})
+        assert len(server.peers) == 3
+
+        server.peers.clear()
+        with client:
+            for _ in range(3):
+                client.query(query, {})
+        assert len(server.peers) == 1
+
+
+def test_fetch_boards_in_session():
+
+    board = load_board()
+
+    with StubMondayServer({1: board, 2: board}) as server:
+        with stub_client(server) as client:
+            results = client.fetch_boards([1, 2], page_size=2)
+            assert results[2]["monday_id"].to_list() == [int(item["id"]) for item in board["items"]]
+            assert client.query("query { boards(ids: [1]) { columns { id } } }", {})
+
+
+def test_async_session_reuses_connection():
+
+    query = "query { boards(ids: [1]) { columns { id } } }"
+
+    async def run(client):
+        async with client:
+            for _ in range(3):
+                await client.query_async(query)
+            await client.fetch_boards_async([1], page_size=2)
+
+    with StubMondayServer({1: load_board()}) as server:
+        client = MondayDotComClient(url=server.url, pool_size=1, schema="none")
+        asyncio.run(run(client))
+
+    assert len(server.requests) == 3 + 1 + 3
+    assert len(server.peers) == 1
+
+
+def test_transport_refuses_subscriptions():
+
+    transport = PooledAIOHTTPTransport(url="http://localhost")
+
+    with pytest.raises(NotImplementedError):
+        transport.subscribe(gql("subscription { updates { id } }"))
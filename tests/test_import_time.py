@@ -0,0 +1,43 @@
+# pylint: disable="missing-module-docstring"
+import subprocess
+import sys
+from pathlib import Path
+
+import mondaydotcom_utils
+from benchmarks.import_time import HEAVY_MODULES
+
+BOARD_PATH = Path(__file__).parent / "resources" / "test_board.json"
+
+# tests.monday_stub loads aiohttp for its server, so the board is read directly
+FORMAT_ROWS = """
+import json, sys
+import mondaydotcom_utils
+from mondaydotcom_utils.formatted_value import FormattedBoard, to_col_defs
+
+with open({path!r}, encoding="UTF-8") as board_file:
+    board = json.load(board_file)["data"]["boards"][0]
+rows = FormattedBoard(to_col_defs(board["columns"])).load(board["items"]).rows
+assert rows and rows[0]["monday_id"]
+print(" ".join(name for name in {heavy!r} if name in sys.modules))
+"""
+
+
+# pylint: disable="missing-function-docstring"
+def test_formatting_rows_loads_no_heavy_modules():
+
+    output = subprocess.run(
+        [sys.executable, "-c", FORMAT_ROWS.format(path=str(BOARD_PATH), heavy=HEAVY_MODULES)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+    assert output.split() == []
+
+
+def test_lazy_names():
+
+    assert mondaydotcom_utils.FormattedBoard.__module__ == "mondaydotcom_utils.formatted_value"
+    assert mondaydotcom_utils.TTLCache.__name__ == "TTLCache"
+    assert "MondayDotComClient" in dir(mondaydotcom_utils)
+    assert set(mondaydotcom_utils.__all__) <= set(dir(mondaydotcom_utils))
@@ -0,0 +1,83 @@
+# pylint: disable="missing-module-docstring"
+import io
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from mondaydotcom_utils.formatted_value import FormattedBoard, to_col_defs
+from mondaydotcom_utils.ingest import (
+    NEXT_ITEMS_PAGE_PREFIX,
+    fetch_board_json,
+    format_board_json,
+    iter_board_json,
+)
+from mondaydotcom_utils.queries import QueryError
+from tests.monday_stub import StubMondayServer, load_board
+
+# ijson is optional
+pytest.importorskip("ijson")
+
+BOARD_PATH = Path(os.path.dirname(os.path.realpath(__file__))) / "resources" / "test_board.json"
+
+
+# pylint: disable="missing-function-docstring"
+def test_iter_board_json():
+
+    board = load_board()
+    with open(BOARD_PATH, "rb") as file_handle:
+        parsed = list(iter_board_json(file_handle))
+
+    assert [value for kind, value in parsed if kind == "columns"] == board["columns"]
+    assert [value for kind, value in parsed if kind == "items"] == board["items"]
+
+
+def test_format_board_json_matches_formatted_board():
+
+    board = load_board()
+    expected_df = FormattedBoard(to_col_defs(board["columns"])).load(board["items"]).to_df()
+
+    assert format_board_json(BOARD_PATH, batch_size=2).equals(expected_df)
+
+    # a stream with the items first needs the column definitions passed in
+    body = json.dumps({"data": {"boards": [{"items": board["items"]}]}}).encode("UTF-8")
+    with pytest.raises(ValueError):
+        format_board_json(io.BytesIO(body))
+
+    result_df = format_board_json(io.BytesIO(body), col_defs=to_col_defs(board["columns"]))
+    assert result_df.equals(expected_df)
+
+
+def test_iter_next_items_page_json():
+
+    board = load_board()
+    body = {"data": {"next_items_page": {"cursor": "1:4", "items": board["items"][2:4]}}}
+    source = io.BytesIO(json.dumps(body).encode("UTF-8"))
+
+    parsed = list(iter_board_json(source, items_prefix=NEXT_ITEMS_PAGE_PREFIX))
+
+    assert parsed == [("cursor", "1:4"), ("items", board["items"][2]), ("items", board["items"][3])]
+
+
+def test_fetch_board_json_streams_pages():
+
+    board = load_board()
+    expected_df = FormattedBoard(to_col_defs(board["columns"])).load(board["items"]).to_df()
+
+    with StubMondayServer({1: board}) as server:
+        result_df = fetch_board_json(1, "test", url=server.url, page_size=2, batch_size=3)
+
+        # the columns, then three pages of items
+        assert len(server.requests) == 4
+        assert "next_items_page" in server.requests[-1]["query"]
+
+    assert result_df.equals(expected_df)
+
+
+def test_format_board_json_raises_errors():
+
+    body = json.dumps({"errors": [{"message": "Board not found"}]}).encode("UTF-8")
+
+    with pytest.raises(QueryError):
+        format_board_json(io.BytesIO(body))
@@ -0,0 +1,73 @@
+# pylint: disable="missing-module-docstring"
+import pytest
+
+from mondaydotcom_utils import instrumentation
+from mondaydotcom_utils.formatted_value import FormattedBoard, to_col_defs
+from mondaydotcom_utils.graphql import MondayDotComClient
+from tests.monday_stub import StubMondayServer, load_board
+
+
+@pytest.fixture(name="metrics")
+def fixture_metrics():
+    """
+    Collect metrics, from zero, for the length of the test.
+    """
+    instrumentation.reset()
+    instrumentation.enable()
+    yield instrumentation.metrics
+    instrumentation.disable()
+    instrumentation.metrics.callbacks.clear()
+    instrumentation.reset()
+
+
+# pylint: disable="missing-function-docstring"
+def test_metrics_off_by_default():
+
+    board = load_board()
+    formatted_board = FormattedBoard(to_col_defs(board["columns"]))
+    formatted_board.load(board["items"])
+
+    assert not instrumentation.metrics.enabled
+    assert instrumentation.snapshot()["formatters"] == {}
+    assert formatted_board.columns["status"].formatter.__name__ == "format_color_field"
+
+
+# pylint: disable="unused-argument"
+def test_formatter_metrics(metrics):
+
+    board = load_board()
+    FormattedBoard(to_col_defs(board["columns"])).load(board["items"])
+
+    snapshot = instrumentation.snapshot()
+    # 2 color columns on 5 items
+    assert snapshot["formatters"]["color"]["calls"] == 10
+    assert snapshot["formatters"]["color"]["seconds"] > 0
+    assert snapshot["default_formatter"] == {"Hour": 5}
+
+
+def test_query_metrics(metrics):
+
+    events = []
+    instrumentation.add_callback(lambda event, measurements: events.append((event, measurements)))
+
+    with StubMondayServer({1: load_board()}, cost=2500) as server:
+        client = MondayDotComClient(url=server.url, monday_key="test", schema="none")
+        client.query("query { boards(ids: [1]) { columns { id title type } } }", {})
+
+    queries = instrumentation.snapshot()["queries"]
+    assert queries["count"] == 1
+    assert queries["cost"] == 2500
+    assert queries["bytes"] == server.response_bytes[0] > 100
+    assert events[0][0] == "query" and events[0][1]["cost"] == 2500
+
+
+def test_query_metrics_concurrent(metrics):
+
+    with StubMondayServer({1: load_board(), 2: load_board()}, delay=0.02) as server:
+        client = MondayDotComClient(url=server.url, monday_key="test", schema="none")
+        client.fetch_boards([1, 2], page_size=2)
+
+    # each query counts the body it read, even with others in flight
+    queries = metrics.snapshot()["queries"]
+    assert queries["count"] == len(server.response_bytes)
+    assert queries["bytes"] == sum(server.response_bytes)
@@ -0,0 +1,76 @@
+# pylint: disable="missing-module-docstring"
+import pytest
+
+from mondaydotcom_utils import json_backend
+from mondaydotcom_utils.formatted_value import FormattedBoard, to_col_defs
+from tests.monday_stub import load_board
+
+
+@pytest.fixture(name="restore_backend")
+def fixture_restore_backend():
+    """
+    Put the JSON backend back as it was after the test.
+    """
+    backend = json_backend.backend
+    yield
+    json_backend.set_backend(backend)
+
+
+# pylint: disable="missing-function-docstring, unused-argument"
+@pytest.mark.parametrize("name", list(json_backend.BACKENDS))
+def test_backends_format_the_same(name, restore_backend):
+
+    pytest.importorskip(name)
+    board = load_board()
+
+    json_backend.set_backend("json")
+    expected_df = FormattedBoard(to_col_defs(board["columns"])).load(board["items"]).to_df()
+
+    assert json_backend.set_backend(name) == name
+    result_df = FormattedBoard(to_col_defs(board["columns"])).load(board["items"]).to_df()
+
+    assert result_df.equals(expected_df)
+
+
+def test_unknown_backend():
+
+    with pytest.raises(ValueError):
+        json_backend.set_backend("yaml")
+
+
+def test_values_decoded_once(monkeypatch):
+
+    board = load_board()
+    calls = []
+    loads = json_backend.loads
+
+    def counting_loads(value):
+        calls.append(value)
+        return loads(value)
+
+    monkeypatch.setattr(json_backend, "loads", counting_loads)
+    formatted_board = FormattedBoard(to_col_defs(board["columns"])).load(board["items"])
+
+    values = [
+        col["value"]
+        for item in board["items"]
+        for col in item["column_values"]
+        if col["value"] is not None and formatted_board.columns[col["id"]].decode
+    ]
+    # the test board has no dropdown settings, so only its JSON values are decoded, once each
+    assert calls == values
+
+    calls.clear()
+    FormattedBoard(to_col_defs(board["columns"]), bulk_decode=True).load(board["items"])
+    assert len(calls) == 1
+
+
+def test_bulk_decode_formats_the_same():
+
+    board = load_board()
+    col_defs = to_col_defs(board["columns"])
+
+    expected_df = FormattedBoard(col_defs).load(board["items"]).to_df()
+    result_df = FormattedBoard(col_defs, bulk_decode=True).load(board["items"]).to_df()
+
+    assert result_df.equals(expected_df)
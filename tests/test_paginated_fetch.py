@@ -0,0 +1,93 @@
+# pylint: disable="missing-module-docstring"
+import threading
+
+import pytest
+
+from mondaydotcom_utils.formatted_value import (
+    concat_chunks,
+    get_items_by_board,
+    iter_board_pages,
+    stream_items_by_board,
+)
+from mondaydotcom_utils.queries import filter_query_params, to_literal
+from mondaydotcom_utils.testing import FakeMondayClient
+from tests.monday_stub import StubMondayServer, load_board, stub_client
+
+
+# pylint: disable="missing-function-docstring"
+def test_iter_board_pages_follows_cursors():
+
+    conn = FakeMondayClient({123: load_board()})
+
+    pages = list(iter_board_pages(conn, 123, page_size=2))
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert conn.count("execute") == 3
+    assert "items_page(limit: 2)" in conn.calls[0][1]
+
+
+def test_stream_items_by_board_chunks_concat():
+
+    board = load_board()
+    conn = FakeMondayClient({123: board})
+
+    chunks = list(stream_items_by_board(conn, 123, page_size=2))
+    result_df = concat_chunks(chunks)
+
+    assert len(chunks) == 3
+    assert all(chunk.columns.to_list() == chunks[0].columns.to_list() for chunk in chunks)
+    assert result_df["monday_id"].to_list() == [int(item["id"]) for item in board["items"]]
+    assert str(result_df["Status__text"].dtype) == "category"
+
+
+def test_filter_query_params():
+
+    query_params = filter_query_params(
+        [("date4", "between", ["2022-05-01", "2022-05-31"]), ("text", "is_empty")], "or"
+    )
+
+    assert to_literal(query_params) == (
+        '{rules: [{column_id: "date4", compare_value: ["2022-05-01", "2022-05-31"], '
+        'operator: between}, {column_id: "text", compare_value: [], operator: is_empty}], '
+        "operator: or}"
+    )
+    with pytest.raises(ValueError):
+        filter_query_params([("text", "equals", "a")])
+    with pytest.raises(ValueError):
+        filter_query_params([("text", "is_empty")], "xor")
+
+
+def test_get_items_by_board_filters():
+
+    conn = FakeMondayClient({123: load_board()})
+
+    result_df = get_items_by_board(
+        conn, 123, filters=[("Status", "any_of", [1, 2]), ("numbers", "greater_than", 3)]
+    )
+
+    query = conn.calls[-1][1]
+    assert 'query_params: {rules: [{column_id: "status", compare_value: [1, 2]' in query
+    assert "operator: greater_than}], operator: and}" in query
+    assert conn.count("fetch_items_by_board_id") == 0
+    # the stub doesn't filter
+    assert len(result_df) == 5
+
+
+def test_iter_board_pages_in_sync_session():
+
+    board = load_board()
+    with StubMondayServer({1: board}) as server:
+        with stub_client(server) as client:
+            main_thread = threading.get_ident()
+            threads = set()
+            run = client._run  # pylint: disable="protected-access"
+
+            def record_thread(coroutine):
+                threads.add(threading.get_ident())
+                return run(coroutine)
+
+            client._run = record_thread  # pylint: disable="protected-access"
+            pages = list(iter_board_pages(client, 1, page_size=2))
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert threads == {main_thread}
@@ -0,0 +1,107 @@
+# pylint: disable="missing-module-docstring"
+import pytest
+from gql.transport.exceptions import TransportServerError
+
+from mondaydotcom_utils.rate_limit import ComplexityBudget, RetryPolicy, with_complexity
+from tests.monday_stub import FakeClock, StubMondayServer, load_board, stub_client
+
+
+# pylint: disable="missing-function-docstring"
+def test_with_complexity():
+
+    query, tracked = with_complexity("query { boards { id } }")
+    assert tracked
+    assert query.startswith("query { complexity { query after reset_in_x_seconds }")
+
+    query, tracked = with_complexity("query { complexity { query } boards { id } }")
+    assert not tracked
+
+
+def test_budget_schedules_over_windows():
+
+    clock = FakeClock()
+    budget = ComplexityBudget(budget=1000, window=60, default_cost=400, clock=clock)
+
+    assert budget.reserve(400) == 0
+    assert budget.reserve(400) == 0
+    # only 200 left, so the third waits for the window to reset
+    assert budget.reserve(400) == 60
+    # and a fourth waits a further window
+    clock.now = 30
+    assert budget.reserve(1000) == 30 + 60
+
+    clock.now = 61
+    assert budget.state()["remaining"] == -1200 + 1000
+
+
+def test_budget_records_reported_cost():
+
+    clock = FakeClock()
+    budget = ComplexityBudget(budget=1000, default_cost=400, clock=clock)
+
+    reserved = budget.estimate("query { boards { id } }")
+    budget.reserve(reserved)
+    budget.record("query { boards { id } }", reserved, {"query": 100, "after": 850})
+
+    assert budget.estimate("query { boards { id } }") == 100
+    assert budget.state()["remaining"] == 850
+
+
+def test_retry_policy_classify():
+
+    retryable, throttled, _ = RetryPolicy.classify(TransportServerError("busy", 503))
+    assert retryable and not throttled
+
+    retryable, throttled, retry_after = RetryPolicy.classify(
+        TransportServerError("slow down", 429), {"Retry-After": "7"}
+    )
+    assert retryable and throttled and retry_after == 7
+
+    retryable, _, _ = RetryPolicy.classify(TransportServerError("bad", 400))
+    assert not retryable
+
+
+def test_query_retries_throttled_and_tracks_budget():
+
+    with StubMondayServer({1: load_board()}, cost=2500) as server:
+        server.failures = [
+            (
+                429,
+                {
+                    "errors": [
+                        {
+                            "message": "Complexity budget exhausted",
+                            "extensions": {
+                                "code": "COMPLEXITY_BUDGET_EXHAUSTED",
+                                "retry_in_seconds": 0.01,
+                            },
+                        }
+                    ]
+                },
+                {},
+            ),
+            (503, "unavailable", {}),
+        ]
+        client = stub_client(server, retry=RetryPolicy(base_delay=0.01))
+
+        result = client.query("query { boards(ids: [1]) { columns { id title type } } }", {})
+
+    assert len(server.requests) == 3
+    assert "complexity" not in result
+    assert result["boards"][0]["columns"][0]["id"] == "name"
+
+    state = client.budget_state()
+    assert state["throttled"] == 1
+    assert state["remaining"] == 1_000_000 - 2500
+
+
+def test_query_gives_up_after_max_attempts():
+
+    with StubMondayServer({1: load_board()}) as server:
+        server.failures = [(500, "down", {})] * 3
+        client = stub_client(server, retry=RetryPolicy(max_attempts=2, base_delay=0.01))
+
+        with pytest.raises(TransportServerError):
+            client.query("query { boards(ids: [1]) { columns { id } } }", {})
+
+    assert len(server.requests) == 2
@@ -0,0 +1,117 @@
+# pylint: disable="missing-module-docstring"
+from mondaydotcom_utils.formatted_value import (
+    FormattedBoard,
+    get_items_by_board,
+    to_col_defs,
+)
+from mondaydotcom_utils.relations import RelationResolver
+from mondaydotcom_utils.testing import FakeMondayClient
+from tests.monday_stub import load_board
+
+
+# pylint: disable="missing-function-docstring"
+def test_resolve_linked_names_in_batches():
+
+    conn = FakeMondayClient({123: load_board()})
+    result_df = get_items_by_board(conn, 123)
+    calls = len(conn.calls)
+
+    resolver = RelationResolver(conn, batch_size=2)
+    result_df = resolver.resolve(result_df, ["Dependency", "Test Board", "Subitems"])
+
+    # 3 linked items, plus a subitem not on any board, looked up 2 at a time
+    assert len(conn.calls) - calls == 2
+    assert result_df["Dependency__name"].to_list() == [
+        ["Item 3", "Item 2"],
+        None,
+        ["Item 2"],
+        None,
+        None,
+    ]
+    assert result_df["Test Board__name"][0] == ["Item 4", "Item 2"]
+    assert result_df["Subitems__name"][0] == [None]
+
+    # the index is shared, so nothing is looked up again
+    resolver.resolve(result_df, ["Dependency"])
+    assert len(conn.calls) - calls == 2
+
+
+def test_resolve_edges():
+
+    board = load_board()
+    conn = FakeMondayClient({123: board})
+    formatted_board = FormattedBoard(to_col_defs(board["columns"]), edges=True)
+    edges = formatted_board.load(board["items"]).to_edges()
+
+    edges_df = RelationResolver(conn).resolve_edges(edges["Test Board"])
+
+    assert edges_df["name"].to_list() == ["Item 4", "Item 2", "Item 2"]
+    assert conn.count("execute") == 1
+
+
+def make_subitem_board(board):
+    """
+    A board holding the one subitem of the test board's first item.
+    """
+    return {
+        "columns": [column for column in board["columns"] if column["id"] in ("name", "status")],
+        "items": [
+            {
+                "id": "2621588113",
+                "name": "Subitem 1",
+                "column_values": [
+                    column
+                    for column in board["items"][0]["column_values"]
+                    if column["id"] == "status"
+                ],
+            }
+        ],
+    }
+
+
+def test_get_items_by_board_with_subitems():
+
+    board = load_board()
+    conn = FakeMondayClient({123: board, 456: make_subitem_board(board)})
+
+    items_df, subitems_df, children = get_items_by_board(conn, 123, subitems=True)
+
+    assert len(items_df) == 5
+    assert children == {
+        2619086128: [2621588113],
+        2619086190: [],
+        2619086253: [],
+        2619086318: [],
+        2619086391: [],
+    }
+    assert subitems_df.columns.to_list() == [
+        "monday_id",
+        "monday_name",
+        "monday_parent_id",
+        "Status__text",
+        "Status__changed_at",
+    ]
+    assert subitems_df["monday_parent_id"].to_list() == [2619086128]
+    assert subitems_df["Status__text"].to_list() == items_df["Status__text"][:1].to_list()
+
+
+def test_get_subitems_of_projected_columns():
+
+    board = load_board()
+    conn = FakeMondayClient({123: board, 456: make_subitem_board(board)})
+
+    items_df, subitems_df, children = get_items_by_board(
+        conn, 123, columns=["Status"], subitems=True
+    )
+
+    # the subitems column is fetched to find the subitems, but not formatted
+    assert items_df.columns.to_list() == [
+        "monday_id",
+        "monday_name",
+        "Status__text",
+        "Status__changed_at",
+    ]
+    page_query = next(query for _, query in conn.calls if "items_page" in str(query))
+    assert 'column_values(ids: ["status", "subitems"])' in page_query
+    assert children[2619086128] == [2621588113]
+    assert subitems_df["monday_parent_id"].to_list() == [2619086128]
@@ -0,0 +1,83 @@
+# pylint: disable="missing-module-docstring"
+import pytest
+
+from mondaydotcom_utils.cache import TTLCache
+from mondaydotcom_utils.formatted_value import iter_board_pages
+from mondaydotcom_utils.graphql import MondayDotComClient
+from mondaydotcom_utils.queries import query_cache_key
+from tests.monday_stub import StubMondayServer, load_board, stub_client
+
+COLUMNS_QUERY = "query { boards(ids: [1]) { columns { id title type } } }"
+
+
+# pylint: disable="missing-function-docstring"
+def test_query_cache_key_ignores_layout():
+
+    assert query_cache_key(COLUMNS_QUERY) == query_cache_key(
+        """query {
+            boards(ids: [1]) {
+                columns { id title type }
+            }
+        }""",
+        {},
+    )
+    assert query_cache_key('query { a(b: "x  y") }') != query_cache_key('query { a(b: "x y") }')
+    assert query_cache_key(COLUMNS_QUERY, {"a": 1}) != query_cache_key(COLUMNS_QUERY)
+
+
+def test_repeated_queries_are_cached():
+
+    with StubMondayServer({1: load_board()}) as server:
+        client = stub_client(server, response_cache=TTLCache())
+        first = client.query(COLUMNS_QUERY, {})
+        first["boards"].clear()
+        second = client.query(COLUMNS_QUERY, {})
+
+        assert len(server.requests) == 1
+        assert second["boards"][0]["columns"][0]["id"] == "name"
+
+
+def test_record_and_replay(tmp_path):
+
+    with StubMondayServer({1: load_board()}) as server:
+        client = stub_client(
+            server, response_cache=TTLCache(directory=tmp_path), cache_mode="record"
+        )
+        expected = list(iter_board_pages(client, 1, page_size=2))
+        recorded = len(server.requests)
+
+    # the server is gone, so everything comes from the recording
+    client = MondayDotComClient(
+        url=server.url,
+        schema="none",
+        response_cache=TTLCache(directory=tmp_path),
+        cache_mode="replay",
+    )
+    assert list(iter_board_pages(client, 1, page_size=2)) == expected
+    assert recorded == 3
+
+    with pytest.raises(LookupError):
+        client.query("query { boards(ids: [2]) { columns { id } } }", {})
+
+
+def test_record_and_replay_fetch_boards(tmp_path):
+
+    boards = {1: load_board(), 2: load_board()}
+    with StubMondayServer(boards) as server:
+        client = stub_client(
+            server, response_cache=TTLCache(directory=tmp_path), cache_mode="record"
+        )
+        expected = client.fetch_boards(boards, page_size=2)
+        recorded = len(server.requests)
+
+    # every query fetch_boards made was recorded, and is replayed without the server
+    assert len(list(tmp_path.iterdir())) == recorded == 2 * (1 + 3)
+    client = MondayDotComClient(
+        url=server.url,
+        schema="none",
+        response_cache=TTLCache(directory=tmp_path),
+        cache_mode="replay",
+    )
+    with client:
+        results = client.fetch_boards(boards, page_size=2)
+    assert all(results[board_id].equals(expected[board_id]) for board_id in boards)
@@ -0,0 +1,95 @@
+# pylint: disable="missing-module-docstring"
+import pytest
+from graphql import GraphQLError, build_schema
+
+from mondaydotcom_utils.graphql import MondayDotComClient
+from mondaydotcom_utils.schema import (
+    load_schema_snapshot,
+    save_schema_snapshot,
+    schema_cache_path,
+)
+from tests.monday_stub import StubMondayServer, load_board
+
+# just enough of the monday.com schema for the stub's column queries
+SDL = """
+type Query {
+    boards(ids: [ID!]): [Board]
+    complexity: Complexity
+}
+
+type Board {
+    columns: [Column]
+}
+
+type Column {
+    id: ID!
+    title: String
+    type: String
+    settings_str: String
+}
+
+type Complexity {
+    query: Int
+    after: Int
+    reset_in_x_seconds: Int
+}
+"""
+
+QUERY = "query { boards(ids: [1]) { columns { id title } } }"
+
+
+# pylint: disable="missing-function-docstring"
+def test_snapshot_version_check(tmp_path):
+
+    path = tmp_path / "schema.graphql"
+    save_schema_snapshot(build_schema(SDL), path, api_version="2024-01")
+
+    assert load_schema_snapshot(path, api_version="2024-01").query_type.name == "Query"
+    assert load_schema_snapshot(path, api_version="2024-04") is None
+    assert load_schema_snapshot(path, api_version="2024-04", check_version=False) is not None
+    assert load_schema_snapshot(tmp_path / "missing.graphql") is None
+
+
+def test_client_validates_against_snapshot(tmp_path):
+
+    path = tmp_path / "schema.graphql"
+    save_schema_snapshot(build_schema(SDL), path)
+
+    with StubMondayServer({1: load_board()}) as server:
+        client = MondayDotComClient(url=server.url, schema=str(path))
+        assert client.client.schema is None
+
+        result = client.query(QUERY, {})
+        assert result["boards"][0]["columns"][0]["title"] == "Name"
+
+        with pytest.raises(GraphQLError):
+            client.query("query { boards(ids: [1]) { no_such_field } }", {})
+
+    # validation failed locally, and the schema was never introspected
+    assert len(server.requests) == 1
+
+
+def test_client_uses_cached_snapshot(tmp_path, monkeypatch):
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    save_schema_snapshot(build_schema(SDL), schema_cache_path("2024-01"), api_version="2024-01")
+
+    with StubMondayServer({1: load_board()}) as server:
+        client = MondayDotComClient(url=server.url, schema="cached", api_version="2024-01")
+        client.query(QUERY, {})
+
+    assert len(server.requests) == 1
+    assert client.client.schema.get_type("Column") is not None
+
+
+def test_save_schema_without_schema(tmp_path, monkeypatch):
+
+    client = MondayDotComClient(url="http://127.0.0.1:1/", schema="none")
+
+    async def fetch_nothing():
+        pass
+
+    monkeypatch.setattr(client, "_fetch_schema", fetch_nothing)
+    with pytest.raises(RuntimeError):
+        client.save_schema(str(tmp_path / "schema.graphql"))
+    assert not list(tmp_path.iterdir())
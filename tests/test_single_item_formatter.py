@@ -105,3 +105,25 @@ def test_board_item1_formatter():
         "Check__checked": True,
         "Check__changed_at": "2022-05-03T00:47:16.789Z",
     }
+
+
+def test_dropdown_labels_compiled_once():
+
+    col_defs = {
+        "dropdown": {
+            "id": "dropdown",
+            "title": "Dropdown",
+            "type": "dropdown",
+            "settings_str": '{"labels":[{"id":1,"name":"Alpha"},{"id":2,"name":"Beta"}]}',
+        }
+    }
+
+    item_formatter = FormattedValue(col_defs)
+    column = item_formatter.columns["dropdown"]
+
+    assert column.title == "Dropdown"
+    assert column.settings["label_map"] == {1: "Alpha", 2: "Beta"}
+    assert item_formatter.format("dropdown", '{"ids":[2,1]}', "Beta, Alpha") == {
+        "Dropdown": "Beta, Alpha"
+    }
+    assert item_formatter.format("dropdown", None, "") == {"Dropdown": None}
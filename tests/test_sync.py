@@ -0,0 +1,63 @@
+# pylint: disable="missing-module-docstring"
+import copy
+
+from mondaydotcom_utils.sync import load_snapshot, sync_board
+from mondaydotcom_utils.testing import FakeMondayClient
+from tests.monday_stub import load_board
+
+
+def board_with_timestamps():
+    """
+    The test board, with every item last updated long ago.
+    """
+    board = copy.deepcopy(load_board())
+    for item in board["items"]:
+        item["updated_at"] = "2022-05-03T00:00:00Z"
+    return board
+
+
+# pylint: disable="missing-function-docstring"
+def test_sync_board_incremental(tmp_path):
+
+    board = board_with_timestamps()
+    conn = FakeMondayClient({123: board})
+
+    first_df = sync_board(conn, 123, tmp_path, page_size=2)
+    assert len(first_df) == 5
+    assert load_snapshot(tmp_path)[1]["board_id"] == "123"
+
+    # rename one item, delete another and add a new one
+    board["items"][1]["name"] = "Renamed"
+    board["items"][1]["updated_at"] = "2999-01-01T00:00:00Z"
+    deleted = board["items"].pop(3)
+    new_item = copy.deepcopy(board["items"][0])
+    new_item["id"] = "42"
+    new_item["updated_at"] = "2999-01-01T00:00:00Z"
+    board["items"].append(new_item)
+
+    conn.calls.clear()
+    result_df = sync_board(conn, 123, tmp_path, page_size=2)
+
+    assert result_df["monday_id"].to_list() == [
+        int(board["items"][0]["id"]),
+        int(board["items"][1]["id"]),
+        int(board["items"][2]["id"]),
+        int(board["items"][3]["id"]),
+        42,
+    ]
+    assert int(deleted["id"]) not in result_df["monday_id"].to_list()
+    assert result_df["monday_name"].to_list()[1] == "Renamed"
+    assert result_df.dtypes.equals(first_df.dtypes)
+
+    # the changes were fetched with a filter and the deletions with only ids
+    queries = [query for call, query in conn.calls if call == "execute"]
+    assert "__last_updated__" in queries[0]
+    assert any("column_values" not in query for query in queries)
+
+    saved_df, _ = load_snapshot(tmp_path)
+    assert saved_df.equals(result_df)
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "dtypes.json",
+        "items.json",
+        "state.json",
+    ]
@@ -0,0 +1,24 @@
+# pylint: disable="missing-module-docstring"
+from benchmarks.run import main
+from benchmarks.synthetic import KNOWN_TYPES, UNKNOWN_TYPES, make_board, make_col_defs
+from mondaydotcom_utils.formatted_value import FormattedBoard
+
+
+# pylint: disable="missing-function-docstring"
+def test_synthetic_board_formats():
+
+    board = make_board(items=50, seed=1)
+    result_df = FormattedBoard(make_col_defs(board)).load(board["items"]).to_df()
+
+    assert len(result_df) == 50
+    assert {column["type"] for column in board["columns"][1:]} == set(KNOWN_TYPES + UNKNOWN_TYPES)
+    # the unknown types fall back to the default formatter
+    assert result_df["Hour 0__default_formatter"].any()
+    assert str(result_df["Numeric 0"].dtype) == "Float64"
+
+
+def test_benchmarks_run(capsys):
+
+    main(["--items", "20", "--repeat", "1"])
+
+    assert "FormattedBoard.format + to_df" in capsys.readouterr().out
@@ -0,0 +1,91 @@
+# pylint: disable="missing-module-docstring"
+import json
+import urllib.request
+
+import pandas as pd
+
+from mondaydotcom_utils.formatted_value import FormattedBoard, to_col_defs
+from mondaydotcom_utils.webhooks import LiveBoard, WebhookReceiver
+from tests.monday_stub import load_board
+
+STATUS_EVENT = {
+    "event": {
+        "type": "update_column_value",
+        "boardId": 123,
+        "pulseId": 2619086190,
+        "pulseName": "Item 2",
+        "columnId": "status",
+        "columnType": "color",
+        "value": {"label": {"index": 1, "text": "Done"}, "post_id": None},
+        "previousValue": None,
+        "changedAt": 1651520901.5,
+    }
+}
+
+
+def post(url, body):
+    """
+    POST `body` as JSON and return the decoded answer.
+    """
+    request = urllib.request.Request(
+        url, data=json.dumps(body).encode("UTF-8"), headers={"Content-Type": "application/json"}
+    )
+    with urllib.request.urlopen(request) as response:  # nosec
+        return json.loads(response.read())
+
+
+# pylint: disable="missing-function-docstring"
+def test_live_board_applies_events():
+
+    board = load_board()
+    col_defs = to_col_defs(board["columns"])
+    live_board = LiveBoard(col_defs, board["items"], board_id=123)
+
+    assert live_board.to_df().equals(FormattedBoard(col_defs).load(board["items"]).to_df())
+
+    assert live_board.apply(STATUS_EVENT)
+    live_board.apply(
+        {
+            "type": "update_column_value",
+            "boardId": 123,
+            "pulseId": 2619086190,
+            "columnId": "numbers",
+            "value": {"value": 12, "unit": None},
+        }
+    )
+    live_board.apply(
+        {
+            "type": "create_pulse",
+            "boardId": 123,
+            "pulseId": 1,
+            "pulseName": "New",
+            "columnValues": {"text": {"value": "Hello"}, "date4": {"date": "2022-06-01"}},
+        }
+    )
+    live_board.apply({"type": "delete_pulse", "boardId": 123, "itemId": 2619086128})
+    assert not live_board.apply(dict(STATUS_EVENT["event"], boardId=999))
+
+    result_df = live_board.to_df().set_index("monday_id")
+    assert 2619086128 not in result_df.index
+    assert result_df.loc[2619086190, "Status__text"] == "Done"
+    assert result_df.loc[2619086190, "Status__changed_at"] == pd.Timestamp(
+        "2022-05-02T19:48:21.5", tz="UTC"
+    )
+    assert result_df.loc[2619086190, "Timeline Days"] == 12
+    assert result_df.loc[1, "monday_name"] == "New"
+    assert result_df.loc[1, "Notes"] == "Hello"
+    assert result_df.loc[1, "Date"] == pd.Timestamp("2022-06-01")
+    assert len(result_df) == 5
+
+
+def test_webhook_receiver():
+
+    board = load_board()
+    live_board = LiveBoard(to_col_defs(board["columns"]), board["items"])
+
+    with WebhookReceiver(live_board) as receiver:
+        assert post(receiver.url, {"challenge": "abc"}) == {"challenge": "abc"}
+        assert post(receiver.url, STATUS_EVENT) == {}
+
+    result_df = live_board.to_df()
+    assert result_df.loc[1, "Status__text"] == "Done"
@@ -0,0 +1,99 @@
+# pylint: disable="missing-module-docstring"
+import pandas as pd
+import pytest
+
+from mondaydotcom_utils.formatted_value import get_items_by_board, to_col_defs
+from mondaydotcom_utils.testing import FakeMondayClient
+from mondaydotcom_utils.writeback import diff_changes, encode_date, write_back
+from tests.monday_stub import load_board
+
+
+# pylint: disable="missing-function-docstring"
+def test_write_back_sends_only_changed_cells():
+
+    board = load_board()
+    conn = FakeMondayClient({123: board})
+    original_df = get_items_by_board(conn, 123)
+
+    edited_df = original_df.copy()
+    edited_df.loc[0, "Status__text"] = "Done"
+    edited_df.loc[1, "Notes"] = "Edited"
+    edited_df.loc[2, "Timeline Days"] = 7
+    edited_df.loc[3, "Date"] = pd.Timestamp("2022-06-01")
+    edited_df.loc[4, "Check__checked"] = True
+    edited_df.loc[4, "Timeline__to"] = pd.Timestamp("2022-06-30")
+    edited_df.loc[4, "Timeline__from"] = pd.Timestamp("2022-06-01")
+    edited_df.loc[1, "monday_name"] = "Renamed"
+    calls = len(conn.calls)
+
+    changes = write_back(conn, 123, original_df, edited_df, batch_size=2)
+
+    ids = original_df["monday_id"].to_list()
+    assert changes == {
+        ids[0]: {"status": {"label": "Done"}},
+        ids[1]: {"name": "Renamed", "text": "Edited"},
+        ids[2]: {"numbers": "7"},
+        ids[3]: {"date4": {"date": "2022-06-01"}},
+        ids[4]: {
+            "timeline": {"from": "2022-06-01", "to": "2022-06-30"},
+            "check": {"checked": "true"},
+        },
+    }
+    # the column definitions, then 5 items 2 at a time
+    assert len(conn.calls) - calls == 1 + 3
+    assert [(item_id, values) for _, item_id, values in conn.api.changes] == list(changes.items())
+
+
+def test_unchanged_frames_have_no_changes():
+
+    board = load_board()
+    conn = FakeMondayClient({123: board})
+    original_df = get_items_by_board(conn, 123)
+
+    assert not diff_changes(original_df, original_df.copy(), to_col_defs(board["columns"]))
+
+
+def test_read_only_columns_rejected():
+
+    board = load_board()
+    conn = FakeMondayClient({123: board})
+    original_df = get_items_by_board(conn, 123)
+
+    edited_df = original_df.copy()
+    edited_df.loc[0, "Formula__formula"] = "=1"
+    with pytest.raises(ValueError):
+        diff_changes(original_df, edited_df, to_col_defs(board["columns"]))
+
+
+def test_encode_date_needs_a_timezone_for_naive_times():
+
+    assert encode_date(pd.Timestamp("2022-06-01")) == {"date": "2022-06-01"}
+    assert encode_date(pd.Timestamp("2022-06-01 23:30", tz="America/New_York")) == {
+        "date": "2022-06-02",
+        "time": "03:30:00",
+    }
+    assert encode_date(pd.Timestamp("2022-06-01 23:30"), timezone="America/New_York") == {
+        "date": "2022-06-02",
+        "time": "03:30:00",
+    }
+    with pytest.raises(ValueError):
+        encode_date(pd.Timestamp("2022-06-01 23:30"))
+
+
+def test_diff_changes_localizes_naive_times():
+
+    board = load_board()
+    conn = FakeMondayClient({123: board})
+    original_df = get_items_by_board(conn, 123)
+    col_defs = to_col_defs(board["columns"])
+
+    edited_df = original_df.copy()
+    edited_df.loc[3, "Date"] = pd.Timestamp("2022-06-01 09:00")
+
+    with pytest.raises(ValueError):
+        diff_changes(original_df, edited_df, col_defs)
+
+    changes = diff_changes(original_df, edited_df, col_defs, timezone="Europe/Berlin")
+    assert changes[original_df["monday_id"][3]] == {
+        "date4": {"date": "2022-06-01", "time": "07:00:00"}
+    }